@@ -1,8 +0,0 @@
-"""
-Internal API utilities for the EDF FreePhase Dynamic Tariff integration.
-
-This package contains modules that handle data retrieval, parsing,
-classification, and aligned scheduling for the coordinator. These helpers
-keep coordinator.py focused on orchestration rather than implementation
-details.
-"""
\ No newline at end of file
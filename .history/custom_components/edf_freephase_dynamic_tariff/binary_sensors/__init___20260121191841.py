@@ -1 +0,0 @@
-# Required so Python treats this directory as a package
@@ -1,3 +0,0 @@
-DOMAIN = "edf_freephase_dynamic_tariff"
-
-# End of constants.py
@@ -46,7 +46,9 @@ During setup, the integration stores all runtime objects under:
     }
 
 This allows platforms and services to access coordinators and metadata
-without re‑creating or re‑fetching them.
+without re‑creating or re‑fetching them. The two coordinators are also
+attached to the config entry itself as `entry.runtime_data`
+(`EDFRuntimeData`), which platforms use for direct, typed access.
 
 Coordinator Lifecycle
 ---------------------
@@ -81,6 +83,7 @@ management, and safe teardown.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from datetime import timedelta
 
 from homeassistant.config_entries import (  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
@@ -104,6 +107,14 @@ _LOGGER = logging.getLogger(__name__)
 startup_logger = logging.getLogger("homeassistant.core")
 
 
+@dataclass(slots=True)
+class EDFRuntimeData:
+    """Coordinators stored on `entry.runtime_data` for platform setup."""
+
+    coordinator: EDFCoordinator
+    cost_coordinator: CostCoordinator
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up EDF FreePhase Dynamic Tariff Integration from YAML (not used)."""
     _ = hass, config
@@ -181,6 +192,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "tariff_region_label": entry.data.get("tariff_region_label"),
         "version": manifest_version,
     }
+    entry.runtime_data = EDFRuntimeData(
+        coordinator=coordinator,
+        cost_coordinator=cost_coordinator,
+    )
 
     async def _update_listener(hass, entry):
         """Handle options updates."""
@@ -197,6 +212,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 coordinator.config_entry = entry
             if cost_coordinator:
                 cost_coordinator.config_entry = entry
+                # The cost coordinator caches the flag rather than reading
+                # the options on every update.
+                cost_coordinator.set_debug(entry.options.get("debug_logging", False))
 
     entry.async_on_unload(entry.add_update_listener(_update_listener))
 
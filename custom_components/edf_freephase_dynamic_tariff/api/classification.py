@@ -33,9 +33,96 @@ adjustments to EDF’s rules straightforward to implement.
 
 from __future__ import annotations
 
-from datetime import time
+from datetime import datetime
 
-import dateutil.parser  # pyright: ignore[reportMissingModuleSource] # pylint: disable=import-error # pylance: disable=reportMissingModuleSource
+# ciso8601 is a C parser shipped with Home Assistant; fall back to the stdlib
+# parser (which accepts the "Z" suffix from Python 3.11) if it is unavailable.
+try:
+    from ciso8601 import parse_datetime as _parse_iso  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
+except ImportError:  # pragma: no cover
+    _parse_iso = datetime.fromisoformat
+
+# Phase window boundaries as minutes past midnight.
+_T06 = 6 * 60
+_T16 = 16 * 60
+_T19 = 19 * 60
+_T23 = 23 * 60
+
+def _phase_for_minute(minute_of_day: int) -> str:
+    """Return the time-of-day phase for a positive price."""
+
+    if minute_of_day >= _T23 or minute_of_day < _T06:
+        return "Green"
+
+    if _T16 <= minute_of_day < _T19:
+        return "Red"
+
+    # 06:00–16:00 and 19:00–23:00
+    return "Amber"
+
+
+# Phase for every minute of the day, built once at import so classification
+# is a single tuple index rather than a chain of comparisons.
+_PHASE_BY_MINUTE: tuple[str, ...] = tuple(_phase_for_minute(m) for m in range(24 * 60))
+
+
+def _classify_from_minute(minute_of_day: int, price: float) -> str:
+    """
+    Classify a slot from its start time expressed as minutes past midnight.
+
+    Used by the parsing layer, which has already parsed the slot start into a
+    datetime and should not pay for parsing the same string a second time.
+    """
+
+    if price <= 0:
+        return "Green"
+    return _PHASE_BY_MINUTE[minute_of_day]
+
+
+def parse_edf_iso(value: str) -> tuple[int, int, int, int] | None:
+    """
+    Split an EDF ISO timestamp into (year, month, day, minute_of_day).
+
+    EDF always emits "YYYY-MM-DDTHH:MM:SS" followed by "Z" or an offset, so
+    the fields live at fixed positions and can be read by slicing without
+    constructing a datetime. The date and time are those written in the
+    string (i.e. in its own offset). Returns None for any other shape.
+    """
+
+    if (
+        len(value) < 16
+        or value[4] != "-"
+        or value[7] != "-"
+        or value[10] not in "T "
+        or value[13] != ":"
+    ):
+        return None
+
+    try:
+        return (
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]) * 60 + int(value[14:16]),
+        )
+    except ValueError:
+        return None
+
+
+def _minute_of_day(start_time: str) -> int:
+    """
+    Return minutes past midnight for an ISO timestamp string.
+
+    Uses the fixed-position `parse_edf_iso()` for EDF-shaped timestamps and
+    only falls back to the full ISO parser for anything else.
+    """
+
+    fields = parse_edf_iso(start_time)
+    if fields is not None:
+        return fields[3]
+
+    dt = _parse_iso(start_time)
+    return dt.hour * 60 + dt.minute
 
 
 def classify_slot(start_time: str, price: float) -> str:
@@ -59,26 +146,7 @@ def classify_slot(start_time: str, price: float) -> str:
         - Amber: all other times
     """
 
-    dt = dateutil.parser.isoparse(start_time)
-    t = dt.time()
-
-    if price <= 0:
-        return "Green"
-
-    if time(23, 0) <= t or t < time(6, 0):
-        return "Green"
-
-    if time(6, 0) <= t < time(16, 0):
-        return "Amber"
-
-    if time(16, 0) <= t < time(19, 0):
-        return "Red"
-
-    if time(19, 0) <= t < time(23, 0):
-        return "Amber"
-
-    # Fallback: any unclassified time defaults to Amber
-    return "Amber"
+    return _classify_from_minute(_minute_of_day(start_time), price)
 
 def classify_slots(slots: list[dict]) -> list[dict]:
     """
@@ -90,9 +158,14 @@ def classify_slots(slots: list[dict]) -> list[dict]:
 
     Returns the same list with "phase" set on each slot.
     """
+    # Bind the hot-path callables locally and skip the classify_slot wrapper
+    # so each slot costs one HH:MM extraction and one integer classification.
+    minute_of_day = _minute_of_day
+    classify = _classify_from_minute
+
     for slot in slots:
         start = slot.get("start")
         value = slot.get("value")
         if start is not None and value is not None:
-            slot["phase"] = classify_slot(start, value)
+            slot["phase"] = classify(minute_of_day(start), value)
     return slots  # pylint: disable=missing-final-newline
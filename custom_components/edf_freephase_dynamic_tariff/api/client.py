@@ -17,15 +17,19 @@ The client supports three categories of EDF API responses:
 2. Paginated endpoints (unit‑rate data)
    Returned as a dictionary containing a `results` list and an optional `next`
    URL. The client automatically follows pagination links up to a configurable
-   maximum number of pages, merging all results into a single list.
+   maximum number of pages, merging all results into a single list. When the
+   first page reveals the total count and a `?page=N` link, the remaining
+   pages are requested concurrently.
 
 3. Raw list endpoints
    Rare but valid responses where the API returns a top‑level list without
    pagination or metadata.
 
-Any unexpected or malformed responses are logged and returned as an empty
-dictionary to ensure the coordinator can fail gracefully without raising
-exceptions.
+`fetch_all_pages()` logs unexpected or malformed responses and returns an
+empty dictionary. `iter_pages()`, which streams unit rates into the parser,
+raises `TypeError` instead (for non‑JSON bodies as well as unexpected
+structures) so the coordinator can flag the response as an unexpected
+format and fail gracefully.
 
 This module performs no transformation or interpretation of the returned
 data; parsing, normalisation, and slot construction are handled by the
@@ -35,83 +39,359 @@ data reliably and return it in whatever structure the API provides.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+from collections.abc import AsyncIterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import aiohttp  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
 import async_timeout  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
 
-# Using a local session because the EDF API is lightweight and short‑lived.
-# If future API calls become more frequent, consider async_get_clientsession(hass).
+# orjson ships with Home Assistant and decodes the large paginated unit-rate
+# payloads considerably faster than the stdlib; fall back if it is missing.
+try:
+    from orjson import loads as json_loads  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+# Callers running inside Home Assistant should pass the shared session from
+# async_get_clientsession(hass) so pagination and repeated refreshes reuse warm
+# keep-alive connections. A short-lived local session is only created when no
+# session is supplied (e.g. ad-hoc scripts and tests).
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def fetch_all_pages(api_url: str, max_pages: int = 3):
+class NotModified(Exception):
+    """Raised by `iter_pages()` when a conditional request gets a 304 response."""
+
+
+async def fetch_all_pages(
+    api_url: str,
+    max_pages: int = 3,
+    session: aiohttp.ClientSession | None = None,
+):
     """
     Fetch EDF API data from either:
       - a paginated endpoint (unit rates)
       - a single-object endpoint (product metadata)
       - a list endpoint (rare but supported)
 
+    If `session` is provided it is reused (and left open); otherwise a
+    temporary session is created for the duration of the call. Code running
+    inside Home Assistant should always pass `async_get_clientsession(hass)`
+    so requests share HA's pooled connector; the temporary session exists
+    for standalone use such as the tests.
+
     Returns:
         dict | list
     """
 
-    async with aiohttp.ClientSession() as session:
-        async with async_timeout.timeout(10):
-            resp = await session.get(api_url)
-            resp.raise_for_status()
-
-            try:
-                data = await resp.json()
-            except Exception:  # pylint: disable=broad-exception-caught
-                _LOGGER.error("EDF API returned non‑JSON for URL: %s", api_url)
-                return {}
+    if session is not None:
+        return await _fetch_all_pages(session, api_url, max_pages)
 
-            # ------------------------------------------
-            # CASE 1: Product metadata (flat dict)
-            # ------------------------------------------
-            if isinstance(data, dict) and "results" not in data:
-                _LOGGER.debug("EDF API returned single-object metadata")
-                return data
+    async with aiohttp.ClientSession() as local_session:
+        return await _fetch_all_pages(local_session, api_url, max_pages)
 
-            # ------------------------------------------
-            # CASE 2: Paginated endpoint (unit rates)
-            # ------------------------------------------
-            if isinstance(data, dict) and isinstance(data.get("results"), list):
-                results = []
-                page = data
-                page_count = 1
 
-                while page and page_count <= max_pages:
-                    page_results = page.get("results")
-                    if not isinstance(page_results, list):
-                        _LOGGER.error("EDF API page %s missing/invalid results", page_count)
-                        break
+async def _fetch_all_pages(session: aiohttp.ClientSession, api_url: str, max_pages: int):
+    """Fetch and merge EDF API pages using an existing session."""
 
-                    results.extend(page_results)
+    async with async_timeout.timeout(10):
+        resp = await session.get(api_url)
+        resp.raise_for_status()
 
-                    next_url = page.get("next")
-                    if not next_url:
-                        break
+        try:
+            data = await resp.json(loads=json_loads)
+        except Exception:  # pylint: disable=broad-exception-caught
+            _LOGGER.error("EDF API returned non‑JSON for URL: %s", api_url)
+            return {}
 
-                    _LOGGER.debug("Fetching EDF API page %s: %s", page_count + 1, next_url)
-                    resp = await session.get(next_url)
-                    resp.raise_for_status()
-                    page = await resp.json()
-                    page_count += 1
+        # A single structural dispatch replaces the chain of isinstance
+        # checks and repeated data.get("results") lookups.
+        match data:
+            # ------------------------------------------
+            # CASE 1: Paginated endpoint (unit rates)
+            # ------------------------------------------
+            case {"results": list()}:
+                return await _collect_pages(session, data, max_pages)
 
-                return results
+            # ------------------------------------------
+            # CASE 2: Product metadata (flat dict)
+            # ------------------------------------------
+            case dict() if "results" not in data:
+                _LOGGER.debug("EDF API returned single-object metadata")
+                return data
 
             # ------------------------------------------
             # CASE 3: Unexpected but valid list response
             # ------------------------------------------
-            if isinstance(data, list):
+            case list():
                 _LOGGER.debug("EDF API returned a raw list")
                 return data
 
             # ------------------------------------------
             # CASE 4: Unknown structure
             # ------------------------------------------
-            _LOGGER.error("EDF API returned unexpected structure: %s", type(data))
-            return {}  # pylint: disable=missing-final-newline
+            case _:
+                _LOGGER.error("EDF API returned unexpected structure: %s", type(data))
+                return {}
+
+
+async def _collect_pages(session: aiohttp.ClientSession, data: dict, max_pages: int) -> list:
+    """Merge the first page with up to `max_pages - 1` following pages."""
+
+    concurrent = await _fetch_remaining_pages(session, data, max_pages)
+    if concurrent is not None:
+        return concurrent
+
+    results = []
+    page = data
+    page_count = 1
+    total = data.get("count")
+    if not isinstance(total, int):
+        total = None
+
+    while page and page_count <= max_pages:
+        page_results = page.get("results")
+        if not isinstance(page_results, list):
+            _LOGGER.error("EDF API page %s missing/invalid results", page_count)
+            break
+
+        results.extend(page_results)
+
+        # The advertised count tells us when everything has been received,
+        # even if the API still hands back a `next` link.
+        if total is not None and len(results) >= total:
+            break
+
+        next_url = page.get("next")
+        if not next_url:
+            break
+
+        _LOGGER.debug("Fetching EDF API page %s: %s", page_count + 1, next_url)
+        resp = await session.get(next_url)
+        resp.raise_for_status()
+        page = await resp.json(loads=json_loads)
+        page_count += 1
+
+    return results
+
+
+def _with_page(url: str, page: int) -> str | None:
+    """
+    Return `url` with its `page` query parameter replaced by `page`.
+
+    Returns None if the URL does not carry a page parameter, in which case the
+    pagination scheme is not predictable and callers should follow `next`.
+    """
+
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not any(key == "page" for key, _ in query):
+        return None
+
+    query = [(key, str(page) if key == "page" else value) for key, value in query]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _predicted_page_urls(first_page: dict, max_pages: int) -> list[str] | None:
+    """
+    Derive the URLs for pages 2..N from the first page of a paginated response.
+
+    EDF's paginated endpoints report a total `count` and link to the next
+    page via a `?page=N` URL, so once the first page is known the remaining
+    page URLs can be computed up front.
+
+    Returns None if this does not apply (single page, no count, or a `next`
+    URL without a page parameter).
+    """
+
+    results = first_page["results"]
+    next_url = first_page.get("next")
+    count = first_page.get("count")
+
+    if max_pages <= 1 or not next_url or not isinstance(count, int) or not results:
+        return None
+
+    total_pages = min(max_pages, math.ceil(count / len(results)))
+    urls = [_with_page(next_url, page) for page in range(2, total_pages + 1)]
+    if not urls or any(url is None for url in urls):
+        return None
+    return urls  # type: ignore[return-value]
+
+
+async def _decode_page(resp: aiohttp.ClientResponse):
+    """
+    Decode a page response as JSON.
+
+    Raises:
+        TypeError: if the body is not JSON (e.g. an HTML maintenance page).
+    """
+
+    try:
+        return await resp.json(loads=json_loads)
+    except (aiohttp.ContentTypeError, ValueError) as err:
+        raise TypeError(f"EDF API returned non-JSON for URL: {resp.url}") from err
+
+
+async def _fetch_page(session: aiohttp.ClientSession, url: str):
+    """Fetch and decode a single page, returning the raw JSON."""
+
+    async with async_timeout.timeout(10):
+        resp = await session.get(url)
+        resp.raise_for_status()
+        return await _decode_page(resp)
+
+
+async def _fetch_first_page(session: aiohttp.ClientSession, url: str, validators: dict):
+    """
+    Fetch the first page conditionally on the cache validators in `validators`.
+
+    The request carries `If-None-Match` / `If-Modified-Since` built from any
+    stored `etag` / `last_modified` values. On a 200 response `validators` is
+    replaced with the response's own validators.
+
+    Raises:
+        NotModified: if the server answers 304 Not Modified.
+    """
+
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    async with async_timeout.timeout(10):
+        resp = await session.get(url, headers=headers or None)
+        if resp.status == 304:
+            raise NotModified(url)
+        resp.raise_for_status()
+
+        validators.clear()
+        if etag := resp.headers.get("ETag"):
+            validators["etag"] = etag
+        if last_modified := resp.headers.get("Last-Modified"):
+            validators["last_modified"] = last_modified
+
+        return await _decode_page(resp)
+
+
+async def _get_page_results(session: aiohttp.ClientSession, url: str) -> list:
+    """Fetch a single follow-up page and return its results list."""
+
+    page = await _fetch_page(session, url)
+    page_results = page.get("results") if isinstance(page, dict) else None
+    if not isinstance(page_results, list):
+        _LOGGER.error("EDF API page %s missing/invalid results", url)
+        return []
+    return page_results
+
+
+async def _fetch_remaining_pages(
+    session: aiohttp.ClientSession, first_page: dict, max_pages: int
+) -> list | None:
+    """
+    Fetch pages 2..N concurrently when the page URLs are predictable.
+
+    Returns the merged results, or None if the concurrent path does not apply.
+    """
+
+    urls = _predicted_page_urls(first_page, max_pages)
+    if urls is None:
+        return None
+
+    _LOGGER.debug("Fetching EDF API pages 2-%s concurrently", len(urls) + 1)
+
+    merged = list(first_page["results"])
+    for page_results in await asyncio.gather(*(_get_page_results(session, url) for url in urls)):
+        merged.extend(page_results)
+    return merged
+
+
+async def iter_pages(
+    session: aiohttp.ClientSession,
+    api_url: str,
+    max_pages: int = 3,
+    validators: dict | None = None,
+) -> AsyncIterator[list]:
+    """
+    Yield the results of a paginated EDF endpoint one page at a time.
+
+    Unlike `fetch_all_pages()`, callers can process each batch while the
+    following pages are still in flight: predictable pages are all requested
+    as soon as the first page arrives, otherwise the `next` page is prefetched
+    before the current batch is yielded. A raw list response is yielded as a
+    single batch.
+
+    When `validators` is given, the first page is requested conditionally
+    using the `etag` / `last_modified` values it holds, and the dict is
+    refreshed from the response (see `_fetch_first_page()`). Pass a copy and
+    only keep it once the whole dataset has been consumed successfully.
+
+    Raises:
+        NotModified: if `validators` was given and the first page is unchanged.
+        TypeError: if the endpoint returns a non-JSON body, or neither a
+            paginated object nor a list.
+    """
+
+    if validators is None:
+        data = await _fetch_page(session, api_url)
+    else:
+        data = await _fetch_first_page(session, api_url, validators)
+
+    match data:
+        case {"results": list() as results}:
+            pass
+        case list():
+            _LOGGER.debug("EDF API returned a raw list")
+            yield data
+            return
+        case _:
+            raise TypeError(f"EDF API returned unexpected structure: {type(data)}")
+
+    urls = _predicted_page_urls(data, max_pages)
+    if urls is not None:
+        _LOGGER.debug("Streaming EDF API pages 2-%s concurrently", len(urls) + 1)
+        tasks = [asyncio.ensure_future(_get_page_results(session, url)) for url in urls]
+        try:
+            yield results
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+        return
+
+    page_count = 1
+    received = len(results)
+    total = data.get("count")
+    if not isinstance(total, int):
+        total = None
+    next_url = data.get("next")
+    while True:
+        pending = None
+        complete = total is not None and received >= total
+        if next_url and page_count < max_pages and not complete:
+            _LOGGER.debug("Prefetching EDF API page %s: %s", page_count + 1, next_url)
+            pending = asyncio.ensure_future(_fetch_page(session, next_url))
+
+        try:
+            yield results
+        except BaseException:
+            if pending is not None:
+                pending.cancel()
+            raise
+
+        if pending is None:
+            return
+
+        page = await pending
+        page_count += 1
+        results = page.get("results") if isinstance(page, dict) else None
+        if not isinstance(results, list):
+            _LOGGER.error("EDF API page %s missing/invalid results", page_count)
+            return
+        received += len(results)
+        next_url = page.get("next")
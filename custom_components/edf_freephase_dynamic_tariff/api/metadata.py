@@ -23,19 +23,20 @@ from __future__ import annotations
 from .product import fetch_product_metadata
 
 
-async def build_tariff_metadata(product_url: str, region_label: str) -> dict:
+async def build_tariff_metadata(product_url: str, region_label: str, session=None) -> dict:
     """
     Build a unified metadata dictionary describing the tariff product.
 
     Parameters:
         product_url: The EDF product metadata endpoint.
         region_label: The human-readable region label selected in config flow.
+        session: Optional shared aiohttp session passed through to the fetch.
 
     Returns:
         A dictionary containing merged product + region metadata.
     """
 
-    product_meta = await fetch_product_metadata(product_url)
+    product_meta = await fetch_product_metadata(product_url, session=session)
 
     base = {
         "product_name": "EDF FreePhase Dynamic Tariff",
@@ -11,25 +11,25 @@ components operate on clean, predictable slot dictionaries.
 The responsibilities of this module include:
 
 1. Normalising raw API items
-   `build_unified_dataset()` converts EDF’s unit‑rate objects into a standard
-   slot structure with:
-       • start/end timestamps (raw + ISO)
+   `build_unified_dataset()` converts EDF’s unit‑rate objects into
+   `UnifiedSlot` instances carrying:
+       • raw start/end timestamps and their parsed datetimes
        • VAT‑inclusive price
-       • phase classification (via `classification.classify_slot`)
+       • phase classification (via the `classification` rules)
        • currency metadata
-       • internal datetime objects used for sorting and boundary calculations
+
+   `build_unified_dataset_stream()` does the same for paginated responses,
+   consuming batches as they arrive so parsing overlaps network I/O.
 
    The unified dataset is always returned in chronological order.
 
-2. Stripping internal fields
-   `strip_internal()` removes private datetime objects used for sorting
-   (`_start_dt_obj`, `_end_dt_obj`) before data is exposed to sensors,
-   diagnostics, or event entities. This keeps the public representation clean
-   while preserving efficient internal operations.
+2. Exposing slots
+   `normalise_unified_slot()` turns a `UnifiedSlot` into the plain,
+   sensor‑ready slot dictionary, reusing the already‑parsed datetimes.
 
 3. Building forecast windows
-   `build_forecasts()` constructs the four key forecast datasets used
-   throughout the integration:
+   `forecast_bounds()` locates, and `build_forecasts()` slices out, the four
+   key forecast datasets used throughout the integration:
        • next 24 hours (48 half‑hour slots)
        • today’s slots
        • tomorrow’s slots
@@ -39,10 +39,10 @@ The responsibilities of this module include:
    current UTC time.
 
 4. Producing normalised forecast output
-   `build_normalised_forecasts()` converts all forecast datasets into the
-   final, sensor‑ready slot format using `normalise_slot()`. This ensures that
-   every consumer—sensors, diagnostics, event entities—receives a consistent,
-   minimal, and serialisable structure.
+   `build_normalised_forecasts()` normalises the unified list once with
+   `normalise_unified_slot()` and slices every forecast window out of it. This
+   ensures that every consumer—sensors, diagnostics, event entities—receives a
+   consistent, minimal, and serialisable structure.
 
 By centralising all parsing and transformation logic here, the integration
 maintains a clear separation of concerns: the HTTP client retrieves raw data,
@@ -52,15 +52,58 @@ consume that model without needing to understand EDF’s API quirks.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from operator import attrgetter
+
+from ..helpers import normalise_phase
+from .classification import _classify_from_minute, _parse_iso
+
+
+@dataclass(slots=True)
+class UnifiedSlot:
+    """
+    A single half‑hour tariff slot in the unified internal representation.
+
+    `start`/`end` are the raw ISO strings from the API and `start_dt`/`end_dt`
+    the parsed, timezone‑aware datetimes used for sorting and comparisons.
+    """
+
+    start: str
+    end: str
+    start_dt: datetime
+    end_dt: datetime
+    value: float
+    phase: str
+    currency: str = "GBP"
+
+
+_start_key = attrgetter("start_dt")
+_start_str_key = attrgetter("start")
+
+
+def _sort_unified(unified: list[UnifiedSlot]) -> None:
+    """
+    Sort unified slots chronologically in place.
+
+    When every raw start string is UTC ("...Z") and the same length, the
+    strings sort chronologically as plain text, and string comparison is much
+    cheaper than comparing aware datetimes. Mixed offsets or formats fall back
+    to sorting on the parsed datetime.
+    """
 
-import dateutil.parser  # pyright: ignore[reportMissingImports, reportMissingModuleSource] # pylint: disable=import-error
+    if unified:
+        length = len(unified[0].start)
+        if all(len(s.start) == length and s.start.endswith("Z") for s in unified):
+            unified.sort(key=_start_str_key)
+            return
 
-from ..helpers import normalise_slot
-from .classification import classify_slot
+    unified.sort(key=_start_key)
 
 
-def build_unified_dataset(raw_items: list[dict]) -> list[dict]:
+def build_unified_dataset(raw_items: list[dict]) -> list[UnifiedSlot]:
     """
     Convert raw EDF API items into a unified internal slot structure.
 
@@ -68,78 +111,129 @@ def build_unified_dataset(raw_items: list[dict]) -> list[dict]:
         raw_items: A list of dictionaries returned directly from the EDF API.
 
     Returns:
-        A list of slot dictionaries containing:
-            - start/end timestamps (raw + ISO)
+        A list of `UnifiedSlot` instances containing:
+            - raw start/end timestamps
+            - parsed start/end datetimes
             - price and currency
             - phase classification
-            - internal datetime objects for sorting
 
     Notes:
         - The returned list is sorted chronologically by start time.
-
-        - Internal datetime objects (_start_dt_obj, _end_dt_obj) are included
-          to support efficient sorting and comparisons before being stripped
-          out for sensor exposure.
     """
 
     unified = []
+    append = unified.append
+    parse = _parse_iso
+    classify = _classify_from_minute
 
     for item in raw_items:
         start_raw = item["valid_from"]
-        end_raw = item["valid_to"]
-
-        start_dt = dateutil.parser.isoparse(start_raw)
-        end_dt = dateutil.parser.isoparse(end_raw)
-
-        unified.append(
-            {
-                "start": start_raw,
-                "end": end_raw,
-                "start_dt": start_dt.isoformat(),
-                "end_dt": end_dt.isoformat(),
-                "value": item["value_inc_vat"],
-                "phase": classify_slot(start_raw, item["value_inc_vat"]),
-                "currency": "GBP",
-                "_start_dt_obj": start_dt,
-                "_end_dt_obj": end_dt,
-            }
+        start_dt = parse(start_raw)
+        value = item["value_inc_vat"]
+
+        append(
+            UnifiedSlot(
+                start=start_raw,
+                end=item["valid_to"],
+                start_dt=start_dt,
+                end_dt=parse(item["valid_to"]),
+                value=value,
+                phase=classify(start_dt.hour * 60 + start_dt.minute, value),
+            )
         )
 
-    unified.sort(key=lambda s: s["_start_dt_obj"])
+    _sort_unified(unified)
     return unified
 
 
-def strip_internal(slots: list[dict]) -> list[dict]:
+async def build_unified_dataset_stream(pages: AsyncIterator[list]) -> list[UnifiedSlot]:
+    """
+    Build the unified dataset from an async iterator of raw result batches.
+
+    Each batch is parsed and classified as soon as it arrives (typically from
+    `client.iter_pages()`), overlapping CPU work with the network fetch of the
+    following pages. Batches are individually sorted, so the final sort only
+    has to merge already‑ordered runs.
+
+    Raises:
+        TypeError: if a batch contains anything other than well‑formed
+            dictionaries.
     """
-    Remove internal datetime objects from slot dictionaries.
+
+    unified: list[UnifiedSlot] = []
+    async for batch in pages:
+        # Item types are checked by the parse itself rather than by a
+        # separate pass: subscripting a non-dict raises TypeError.
+        try:
+            unified.extend(build_unified_dataset(batch))
+        except TypeError as err:
+            raise TypeError("EDF API returned non-dict unit-rate items") from err
+
+    _sort_unified(unified)
+    return unified
+
+
+def normalise_unified_slot(slot: UnifiedSlot) -> dict:
+    """
+    Convert a unified slot into the sensor‑ready slot dictionary.
+
+    Produces the same structure as `helpers.normalise_slot()`, but reuses the
+    datetimes parsed in `build_unified_dataset()` instead of re‑parsing the
+    raw timestamp strings.
+    """
+
+    return {
+        "start": slot.start,
+        "end": slot.end,
+        "start_dt": slot.start_dt,
+        "end_dt": slot.end_dt,
+        "value": slot.value,
+        "phase": normalise_phase(slot.phase),
+        "currency": slot.currency,
+    }
+
+
+def forecast_bounds(unified: list[UnifiedSlot], now: datetime) -> dict[str, tuple[int, int]]:
+    """
+    Locate the forecast windows within the unified dataset.
 
     Parameters:
-        slots: A list of unified slot dictionaries containing internal fields.
+        unified: A chronologically sorted list of unified slots.
+        now: The current UTC datetime used to determine boundaries.
 
     Returns:
-        A new list of dictionaries with internal keys removed:
-            - _start_dt_obj
-            - _end_dt_obj
-
-    Notes:
-        This is used before exposing data to sensors or diagnostics.
+        A dictionary mapping each window name (next_24_hours,
+        today_24_hours, tomorrow_24_hours, yesterday_24_hours) to the
+        `(start, stop)` slice indices of that window in `unified`.
     """
 
-    cleaned = []
-    for s in slots:
-        s2 = dict(s)
-        s2.pop("_start_dt_obj", None)
-        s2.pop("_end_dt_obj", None)
-        cleaned.append(s2)
-    return cleaned
+    # `unified` is sorted by start time, so every window is a contiguous
+    # slice whose edges can be located by binary search.
+    def _index(boundary: datetime) -> int:
+        return bisect_left(unified, boundary, key=_start_key)
 
+    start_of_today = datetime.combine(now.date(), time.min, tzinfo=now.tzinfo)
+    day = timedelta(days=1)
+    i_yesterday = _index(start_of_today - day)
+    i_today = _index(start_of_today)
+    i_tomorrow = _index(start_of_today + day)
+    i_after = _index(start_of_today + 2 * day)
+    i_now = _index(now)
 
-def build_forecasts(unified: list[dict], now: datetime) -> dict:
+    return {
+        "next_24_hours": (i_now, min(i_now + 48, len(unified))),
+        "today_24_hours": (i_today, i_tomorrow),
+        "tomorrow_24_hours": (i_tomorrow, i_after),
+        "yesterday_24_hours": (i_yesterday, i_today),
+    }
+
+
+def build_forecasts(unified: list[UnifiedSlot], now: datetime) -> dict:
     """
     Build forecast datasets for today, tomorrow, yesterday, and the next 24 hours.
 
     Parameters:
-        unified: A chronologically sorted list of unified slot dictionaries.
+        unified: A chronologically sorted list of unified slots.
         now: The current UTC datetime used to determine boundaries.
 
     Returns:
@@ -153,24 +247,24 @@ def build_forecasts(unified: list[dict], now: datetime) -> dict:
         next_24_hours returns the next 48 half‑hour slots starting from 'now'.
     """
 
-    today = now.date()
-    tomorrow = (now + timedelta(days=1)).date()
-    yesterday = (now - timedelta(days=1)).date()
-
-    future = [s for s in unified if s["_start_dt_obj"] >= now]
-
     return {
-        "next_24_hours": future[:48],
-        "today_24_hours": [s for s in unified if s["_start_dt_obj"].date() == today],
-        "tomorrow_24_hours": [s for s in unified if s["_start_dt_obj"].date() == tomorrow],
-        "yesterday_24_hours": [s for s in unified if s["_start_dt_obj"].date() == yesterday],
+        name: unified[start:stop]
+        for name, (start, stop) in forecast_bounds(unified, now).items()
     }
 
 
-def build_normalised_forecasts(unified: list[dict], forecasts: dict) -> dict:
+def build_normalised_forecasts(unified: list[UnifiedSlot], bounds: dict) -> dict:
     """
     Convert all forecast datasets into normalised slot structures.
 
+    Parameters:
+        unified: A chronologically sorted list of unified slots.
+        bounds: The window slice indices returned by `forecast_bounds()`.
+
+    Every slot is normalised exactly once; the forecast windows are slices
+    of the normalised list, so slots that appear in several windows share a
+    single normalised dict.
+
     Returns:
         {
             "all_slots_sorted": [...],
@@ -181,12 +275,8 @@ def build_normalised_forecasts(unified: list[dict], forecasts: dict) -> dict:
         }
     """
 
-# pylint: disable=line-too-long
-    return {
-        "all_slots_sorted": [normalise_slot(s) for s in strip_internal(unified)],
-        "next_24_hours": [normalise_slot(s) for s in strip_internal(forecasts["next_24_hours"])],
-        "today_24_hours": [normalise_slot(s) for s in strip_internal(forecasts["today_24_hours"])],
-        "tomorrow_24_hours": [normalise_slot(s) for s in strip_internal(forecasts["tomorrow_24_hours"])],  # pylint: disable=line-too-long
-        "yesterday_24_hours": [normalise_slot(s) for s in strip_internal(forecasts["yesterday_24_hours"])],  # pylint: disable=line-too-long
-    }
-# pylint: disable=line-too-long
+    all_slots_sorted = [normalise_unified_slot(s) for s in unified]
+    normalised = {"all_slots_sorted": all_slots_sorted}
+    for name, (start, stop) in bounds.items():
+        normalised[name] = all_slots_sorted[start:stop]
+    return normalised
@@ -42,15 +42,59 @@ import logging
 import aiohttp  # type: ignore
 import async_timeout  # type: ignore
 
+from .client import json_loads
+
 _LOGGER = logging.getLogger(__name__)
 
 
-async def fetch_product_metadata(product_url: str) -> dict | None:
+def _clean_description(raw_description: str) -> str:
+    """Convert list markup to bullet points and unescape HTML entities."""
+
+    return html.unescape(
+        raw_description.replace("<li>", "• ").replace("</li>", "\n")
+    ).strip()
+
+
+async def _fetch_product_json(session: aiohttp.ClientSession, product_url: str) -> dict | None:
+    """Request the product endpoint and return the decoded JSON, or None on failure."""
+
+    async with async_timeout.timeout(10):
+        resp = await session.get(product_url)
+
+        if resp.status != 200:
+            text = await resp.text()
+            _LOGGER.error(
+                "Product metadata fetch failed (%s): %s — Response: %s",
+                resp.status,
+                product_url,
+                text[:300],
+            )
+            return None
+
+        try:
+            return await resp.json(loads=json_loads)
+        except Exception as json_err:
+            text = await resp.text()
+            _LOGGER.error(
+                "Product metadata JSON decode failed: %s — Raw response: %s",
+                json_err,
+                text[:300],
+            )
+            return None
+
+
+async def fetch_product_metadata(
+    product_url: str,
+    session: aiohttp.ClientSession | None = None,
+) -> dict | None:
     """
     Fetch full product metadata from the EDF product endpoint.
 
     Parameters:
         product_url: The canonical EDF product metadata URL.
+        session: Optional shared aiohttp session to reuse. When omitted, a
+            temporary session is created for this request; callers inside
+            Home Assistant should pass `async_get_clientsession(hass)`.
 
     Returns:
         A dictionary containing product metadata fields, or None on failure.
@@ -61,36 +105,18 @@ async def fetch_product_metadata(product_url: str) -> dict | None:
         return None
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with async_timeout.timeout(10):
-                resp = await session.get(product_url)
-
-                if resp.status != 200:
-                    text = await resp.text()
-                    _LOGGER.error(
-                        "Product metadata fetch failed (%s): %s — Response: %s",
-                        resp.status,
-                        product_url,
-                        text[:300],
-                    )
-                    return None
-
-                try:
-                    data = await resp.json()
-                except Exception as json_err:
-                    text = await resp.text()
-                    _LOGGER.error(
-                        "Product metadata JSON decode failed: %s — Raw response: %s",
-                        json_err,
-                        text[:300],
-                    )
-                    return None
+        if session is not None:
+            data = await _fetch_product_json(session, product_url)
+        else:
+            async with aiohttp.ClientSession() as local_session:
+                data = await _fetch_product_json(local_session, product_url)
+
+        if data is None:
+            return None
 
         raw_description = data.get("description", "")
         try:
-            cleaned_description = html.unescape(
-                raw_description.replace("<li>", "• ").replace("</li>", "\n")
-            ).strip()
+            cleaned_description = _clean_description(raw_description)
         except Exception:
             cleaned_description = raw_description
 
@@ -6,32 +6,27 @@ to avoid API load spikes. It encapsulates all scheduling behaviour used by
 the coordinator, exposing timing details for diagnostics while keeping the
 coordinator itself clean and focused.
 
-Type‑Safety Improvements
-------------------------
-Recent updates introduce explicit type‑narrowing and defensive fallbacks to
-satisfy static type checkers such as Pylance. These checks do not alter runtime
-behaviour: `_initialise_boundary()` and `_advance_boundary()` still guarantee
-that `_next_boundary_utc` is a valid `datetime`. The additional guards simply
-make this contract explicit for static analysis tools.
-
 Design Notes
 ------------
 The scheduler guarantees:
     - All refreshes occur on aligned boundaries (e.g., every 30 minutes).
-    - Jitter is applied to avoid API stampedes.
-    - `_next_boundary_utc` always represents the next valid aligned boundary.
-    - Defensive `None` checks exist only for type‑safety and should never be
-      hit during normal operation.
+    - Jitter is applied to avoid API stampedes. It is a multiplicative hash
+      of the boundary and a per-scheduler salt, so it needs no PRNG call per
+      refresh while still differing between installations and boundaries.
+    - Boundaries are derived with pure integer arithmetic on epoch seconds:
+      the next boundary after `t` is `(t // interval + 1) * interval`, so no
+      boundary state has to be initialised, advanced or cached.
     - The scheduler exposes its internal timing state for diagnostics, but
       never performs API calls itself.
 
 Inline Comments for Contributors
 --------------------------------
 Developers modifying this module should:
-    - Preserve the alignment logic in `_initialise_boundary()`.
-    - Keep type‑narrowing guards (`if boundary is None: return`) even if they
-      appear redundant — they are required for static analysis correctness.
-    - Avoid introducing blocking I/O; all scheduling must remain async.
+    - Preserve the alignment logic in `_seconds_until_boundary()`.
+    - Avoid introducing blocking I/O; scheduling runs in the event loop via
+      `@callback` methods and must never block.
+    - Keep `_next_boundary_monotonic` in step with the wall-clock boundary;
+      the callback is armed with `loop.call_at()` on that monotonic deadline.
     - Ensure any new diagnostic fields are updated in `_compute_delay()`.
 """
 
@@ -39,12 +34,21 @@ Developers modifying this module should:
 from __future__ import annotations
 
 import random
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Awaitable, Callable
 
-from homeassistant.helpers.event import (  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
-    async_call_later,
-)
+from homeassistant.core import HassJob, callback  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
+
+# Maximum jitter added to each refresh, in seconds.
+_MAX_JITTER_SECONDS = 5.0
+
+# Knuth's multiplicative hash constant and the 24-bit mask the jitter hash is
+# reduced to before scaling into [0, _MAX_JITTER_SECONDS].
+_JITTER_MULTIPLIER = 2654435761
+_JITTER_MASK = 0xFFFFFF
+
+_time = time.time
 
 
 class AlignedScheduler:
@@ -53,95 +57,76 @@ class AlignedScheduler:
 
     This class computes aligned refresh boundaries based on the configured
     scan interval, applies jitter to avoid API load spikes, and schedules
-    callbacks using Home Assistant's async_call_later.
+    callbacks directly on the event loop at an absolute monotonic deadline.
     """
 
+    __slots__ = (
+        "hass",
+        "scan_interval",
+        "_interval_seconds",
+        "_next_boundary_monotonic",
+        "_unsub",
+        "_job",
+        "_next_boundary_epoch",
+        "_next_refresh_epoch",
+        "next_refresh_delay",
+        "next_refresh_jitter",
+        "_jitter_salt",
+    )
+
     def __init__(self, hass, scan_interval: timedelta):
         self.hass = hass
         self.scan_interval = scan_interval
 
-        self._next_boundary_utc = None
+        # The interval never changes for the lifetime of the scheduler, so
+        # convert it once rather than on every refresh.
+        self._interval_seconds: int = int(scan_interval.total_seconds())
+
+        # Drawn once so each scheduler (and so each installation) lands on a
+        # different jitter for the same boundary.
+        self._jitter_salt: int = random.getrandbits(16)
+
+        # Next boundary expressed on the event loop's monotonic clock.
+        self._next_boundary_monotonic: float | None = None
         self._unsub = None
+        self._job: HassJob | None = None
+
+        # Epoch seconds of the next boundary / refresh; the matching
+        # datetimes are only built when diagnostics ask for them.
+        self._next_boundary_epoch: float | None = None
+        self._next_refresh_epoch: float | None = None
 
         # exposed for diagnostics
-        self.next_refresh_datetime = None
         self.next_refresh_delay = None
         self.next_refresh_jitter = None
 
     # -------------------------------------------------------------
 
-    def _initialise_boundary(self) -> None:
-        """
-        Initialise the next aligned boundary based on the current UTC time.
-
-        Notes:
-            - The boundary is aligned to the scan interval.
-            - This method is idempotent and only sets the boundary once.
-        """
-
-        if self._next_boundary_utc is not None:
-            return
-
-        now = datetime.now(timezone.utc)
-        interval_seconds = int(self.scan_interval.total_seconds())
-
-        seconds_today = now.hour * 3600 + now.minute * 60 + now.second
-        next_boundary_seconds = ((seconds_today // interval_seconds) + 1) * interval_seconds
-
-        day_start = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
-        self._next_boundary_utc = day_start + timedelta(seconds=next_boundary_seconds)
-
-    def _advance_boundary(self) -> None:
-        """
-        Advance the internal boundary until it lies in the future.
-
-        Notes:
-            - Ensures the next refresh always targets a future aligned interval.
-            - Includes a defensive None‑check to satisfy static type checkers,
-            though `_initialise_boundary()` guarantees a datetime at runtime.
-        """
-
-        if self._next_boundary_utc is None:
-            self._initialise_boundary()
-
-        now = datetime.now(timezone.utc)
-        boundary = self._next_boundary_utc
-        if boundary is None:
-            return # defensive, but satisfies type checkers
-        while boundary <= now:
-            boundary += self.scan_interval
-
-        self._next_boundary_utc = boundary
-
-    def _seconds_until_boundary(self) -> float:
+    def _seconds_until_boundary(self, now: float | None = None) -> float:
         """
         Compute the number of seconds until the next aligned boundary.
 
+        Parameters:
+            now: The current epoch time in seconds, if the caller has already
+                read it.
+
         Returns:
             A positive float representing the delay until the next refresh.
 
         Notes:
-            - `_initialise_boundary()` and `_advance_boundary()` ensure the
-              boundary is set, but a defensive fallback is included for type
-              checkers.
-            - If the computed delta is non‑positive, the scan interval is used.
+            - Boundaries are multiples of the scan interval since the epoch,
+              which for any interval dividing a day matches alignment to UTC
+              midnight.
+            - A suspend or clock jump needs no catch-up: the next boundary is
+              always derived afresh from `now`.
         """
 
-        self._initialise_boundary()
-        self._advance_boundary()
-
-        now = datetime.now(timezone.utc)
-        boundary = self._next_boundary_utc
-        if boundary is None:
-            # Defensive fallback — should never happen, but satisfies type checkers
-            return float(self.scan_interval.total_seconds())
-
-        delta = (boundary - now).total_seconds()
+        if now is None:
+            now = _time()
 
-        if delta <= 0:
-            delta = self.scan_interval.total_seconds()
-
-        return float(delta)
+        interval = self._interval_seconds
+        boundary = (int(now) // interval + 1) * interval
+        return float(boundary - now)
 
     # -------------------------------------------------------------
 
@@ -153,41 +138,80 @@ class AlignedScheduler:
             The total delay in seconds before the next scheduled callback.
 
         Notes:
-            - Jitter is uniformly random between 0 and 5 seconds.
-            - Diagnostic fields are updated for visibility in HA.
+            - Jitter lies between 0 and 5 seconds and is derived from the
+              boundary epoch and the scheduler's salt (see `_jitter_for()`).
+            - Diagnostic fields are updated for visibility in HA; the
+              datetimes are derived lazily from the stored epoch seconds.
+            - The wall clock is read once and shared by every step below.
         """
 
-        base = self._seconds_until_boundary()
-        jitter = random.uniform(0, 5)
+        now = _time()
+        base = self._seconds_until_boundary(now)
+        jitter = self._jitter_for(round(now + base))
         delay = base + jitter
 
+        self._next_boundary_monotonic = self.hass.loop.time() + base
+
         self.next_refresh_delay = delay
         self.next_refresh_jitter = jitter
-        self.next_refresh_datetime = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        self._next_boundary_epoch = now + base
+        self._next_refresh_epoch = now + delay
 
         return delay
 
+    def _jitter_for(self, boundary_epoch: int) -> float:
+        """Return the deterministic jitter, in seconds, for a boundary."""
+
+        mixed = ((boundary_epoch ^ self._jitter_salt) * _JITTER_MULTIPLIER) & _JITTER_MASK
+        return mixed / _JITTER_MASK * _MAX_JITTER_SECONDS
+
+    @property
+    def next_boundary_datetime(self) -> datetime | None:
+        """The next aligned boundary as a UTC datetime (diagnostics only)."""
+
+        epoch = self._next_boundary_epoch
+        return None if epoch is None else datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+    @property
+    def next_refresh_datetime(self) -> datetime | None:
+        """The next refresh time, jitter included, as a UTC datetime (diagnostics only)."""
+
+        epoch = self._next_refresh_epoch
+        return None if epoch is None else datetime.fromtimestamp(epoch, tz=timezone.utc)
+
     # -------------------------------------------------------------
 
-    async def schedule(self, callback: Callable[..., Awaitable]) -> None:
+    @callback
+    def schedule(self, action: Callable[..., Awaitable]) -> None:
         """
         Schedule the next refresh callback.
 
         Parameters:
-            callback: The coroutine to invoke when the delay expires.
+            action: The coroutine function to invoke when the delay expires.
 
         Notes:
-            Any existing scheduled callback is cancelled before scheduling a new one.
+            - Any existing scheduled callback is cancelled before scheduling a new one.
+            - Runs synchronously in the event loop; nothing here needs awaiting.
         """
 
         if self._unsub:
             self._unsub()
             self._unsub = None
 
-        delay = self._compute_delay()
-        self._unsub = async_call_later(self.hass, delay, callback)
+        # The refresh callback is the same every cycle, so wrap it in a
+        # HassJob once instead of on every re-arm.
+        if self._job is None or self._job.target != action:
+            self._job = HassJob(action, "EDF aligned refresh")
+
+        # Arm on the aligned monotonic deadline computed alongside the delay,
+        # so no further clock reads are needed here.
+        self._compute_delay()
+        deadline = self._next_boundary_monotonic + self.next_refresh_jitter
+        handle = self.hass.loop.call_at(deadline, self.hass.async_run_hass_job, self._job)
+        self._unsub = handle.cancel
 
-    async def shutdown(self) -> None:
+    @callback
+    def shutdown(self) -> None:
         """
         Cancel any pending scheduled callback.
 
@@ -36,7 +36,7 @@ from homeassistant.core import HomeAssistant  # pyright: ignore[reportMissingImp
 from .binary_sensors.is_green_slot import (
     EDFFreePhaseDynamicIsGreenSlotBinarySensor,
 )
-from .const import DOMAIN
+from .helpers import edf_device_info
 
 
 async def async_setup_entry(
@@ -46,13 +46,16 @@ async def async_setup_entry(
 ):
     """Set up EDF FreePhase Dynamic Tariff binary sensors."""
 
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator = data["coordinator"]
+    _ = hass
+    coordinator = entry.runtime_data.coordinator
 
     # Coordinator has already been refreshed in __init__.py
 
+    # One DeviceInfo shared by every binary sensor of this entry
+    device_info = edf_device_info(entry.entry_id)
+
     entities = [
-        EDFFreePhaseDynamicIsGreenSlotBinarySensor(coordinator),
+        EDFFreePhaseDynamicIsGreenSlotBinarySensor(coordinator, device_info),
     ]
 
     async_add_entities(entities)
@@ -23,25 +23,29 @@ This sensor:
     - Exposes the full `current_slot` dictionary as attributes for debugging and
       automation logic.
 
-Device metadata is provided via `edf_device_info()` so the entity groups cleanly
-under the integration’s main device in the Home Assistant UI.
+Device metadata is built once by the platform via `edf_device_info()` and
+passed in, so the entity groups cleanly under the integration’s main device in
+the Home Assistant UI.
 """
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import sys
 
 from homeassistant.components.binary_sensor import (  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
     BinarySensorEntity,
 )
+from homeassistant.core import callback  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
 from homeassistant.helpers.update_coordinator import (  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
     CoordinatorEntity,
 )
 
-from ..helpers import (
-    build_entity_id,
-    edf_device_info,
-)
+from homeassistant.helpers.device_registry import DeviceInfo  # pyright: ignore[reportMissingImports] # pylint: disable=import-error
+
+from ..helpers import build_entity_id
+
+
+_GREEN = sys.intern("green")
 
 
 class EDFFreePhaseDynamicIsGreenSlotBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -68,7 +72,7 @@ class EDFFreePhaseDynamicIsGreenSlotBinarySensor(CoordinatorEntity, BinarySensor
     _attr_entity_registry_enabled_default = True
     _attr_device_class = "power"
 
-    def __init__(self, coordinator):
+    def __init__(self, coordinator, device_info: DeviceInfo):
         super().__init__(coordinator)
 
         # Cache config entry for correct device linking
@@ -80,32 +84,60 @@ class EDFFreePhaseDynamicIsGreenSlotBinarySensor(CoordinatorEntity, BinarySensor
             tariff="fpd",
         )
 
-        # Device assignment
-        self._attr_device_info = edf_device_info(self._entry.entry_id)
+        # Device assignment (built once by the platform and shared by every
+        # binary sensor of this entry)
+        self._attr_device_info = device_info
+
+        # State is computed once per coordinator update and stored in the
+        # `_attr_*` fields, so state reads are plain attribute lookups.
+        self._update_from_coordinator()
+
+        # (is_on, attributes, available) as of the last state write.
+        self._last_written: tuple | None = None
 
-    @property
-    def is_on(self) -> Optional[bool]:
+    def _update_from_coordinator(self) -> None:
         """
-        Return True if the current slot is classified as green.
+        Derive `is_on` and the attributes from the coordinator's current slot.
 
-        Returns:
+        `is_on` is:
             True if the slot exists and its phase is "green".
             False if the slot exists but is a different phase.
             None if no current slot is available.
+
+        The full `current_slot` dictionary is exposed as an attribute so
+        automations can inspect timing, duration, and pricing metadata without
+        referencing the coordinator directly.
         """
 
-        data = self.coordinator.data or {}
-        current = data.get("current_slot")
-        return current.get("phase") == "green" if current else None
+        data = self.coordinator.data
+        current = data.get("current_slot") if data else None
+
+        if current:
+            phase = current.get("phase")
+            # Interning lets the phase be compared against _GREEN by identity.
+            self._attr_is_on = isinstance(phase, str) and sys.intern(phase) is _GREEN
+        else:
+            self._attr_is_on = None
+
+        self._attr_extra_state_attributes = {"current_slot": current or {}}
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    @callback
+    def _handle_coordinator_update(self) -> None:
         """
-        Expose the full `current_slot` dictionary for debugging and automation.
+        Recompute the cached state and write it only if something changed.
 
-        This allows advanced automations to inspect timing, duration, and pricing
-        metadata without needing to reference the coordinator directly.
+        Most coordinator ticks fall within the same half‑hour slot, so the
+        state write (and the state‑machine churn behind it) is skipped when
+        the state, attributes and availability are all unchanged.
         """
-        data = self.coordinator.data or {}
-        current = data.get("current_slot") or {}
-        return {"current_slot": current}
+
+        self._update_from_coordinator()
+        # Availability follows the coordinator's last_update_success, which is
+        # already updated by the time listeners run, so compare against the
+        # snapshot taken at the last write rather than a pre-update read.
+        written = (self._attr_is_on, self._attr_extra_state_attributes, self.available)
+        if written == self._last_written:
+            return
+
+        self._last_written = written
+        super()._handle_coordinator_update()
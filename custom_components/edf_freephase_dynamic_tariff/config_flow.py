@@ -49,16 +49,23 @@ entities.
 
 from __future__ import annotations
 
+import asyncio
+import random
+import time
+from functools import lru_cache
+
 # pylint: disable=import-error
-import aiohttp  # pyright: ignore[reportMissingImports] 
+import aiohttp  # pyright: ignore[reportMissingImports]
 import async_timeout  # pyright: ignore[reportMissingImports]
 import voluptuous as vol  # pyright: ignore[reportMissingImports]
 
 from homeassistant import config_entries  # pyright: ignore[reportMissingImports]
 from homeassistant.core import HomeAssistant  # pyright: ignore[reportMissingImports]
+from homeassistant.helpers.aiohttp_client import async_get_clientsession  # pyright: ignore[reportMissingImports]
 from homeassistant.helpers.selector import selector  # pyright: ignore[reportMissingImports]
 # pylint: enable=import-error
 
+from .api.client import json_loads
 from .const import DOMAIN
 from .helpers import get_product_base_url, validate_import_sensor  # pylint: disable=no-name-in-module
 
@@ -83,47 +90,220 @@ FALLBACK_REGIONS = {
     "Region P – Northern Scotland": "EDF_FREEPHASE_DYNAMIC_12M_HH-P",
 }
 
+# Region letter → label, so each API tariff resolves to a label in one lookup
+FALLBACK_BY_LETTER = {
+    code.rpartition("-")[2]: label for label, code in FALLBACK_REGIONS.items()
+}
+
+# Regions rarely change, and a single flow renders several forms that each
+# need them, so a successful fetch is reused for a few minutes.
+_REGIONS_TTL_SECONDS = 300
+
+# (monotonic timestamp of fetch, reachable, region label -> tariff_code,
+#  sorted labels)
+_REGIONS_CACHE: tuple[float, bool, dict[str, str], tuple[str, ...]] | None = None
+
+_FALLBACK_LABELS = tuple(sorted(FALLBACK_REGIONS))
+
+# Product metadata requests: a short timeout and one retry for transient
+# network errors keep a slow or flaky API from stalling the form.
+_FETCH_TIMEOUT_SECONDS = 5
+_FETCH_ATTEMPTS = 2
+
+# Circuit breaker: after `_CB_THRESHOLD` consecutive failed fetches, skip the
+# API for `_CB_COOLDOWN_SECONDS` and answer from the cache or fallback mapping.
+_CB_THRESHOLD = 3
+_CB_COOLDOWN_SECONDS = 120
+_CB_STATE = {"failures": 0, "open_until": 0.0}
+
+# Selectors and schemas that do not depend on the fetched regions or on the
+# entry's current values are built once rather than on every form render.
+_SCAN_SELECTOR = selector({"number": {"min": 1, "max": 120, "step": 1}})
+_SENSOR_SELECTOR = selector({"entity": {"domain": "sensor"}})
+_BOOL_SELECTOR = selector({"boolean": {}})
+
+_CONFIRM_SCHEMA = vol.Schema({vol.Required("confirm_import_sensor", default=False): bool})
+
+
+@lru_cache(maxsize=4)
+def _make_region_selector(labels: tuple[str, ...]):
+    """Build the region select selector for a sorted tuple of labels."""
+    return selector({"select": {"options": list(labels)}})
+
+
+@lru_cache(maxsize=4)
+def _user_schema(labels: tuple[str, ...]) -> vol.Schema:
+    """Build the initial setup schema, whose defaults never change."""
+    return vol.Schema(
+        {
+            vol.Required("tariff_code"): _make_region_selector(labels),
+            vol.Required("scan_interval", default=30): _SCAN_SELECTOR,
+            vol.Optional("import_sensor"): _SENSOR_SELECTOR,
+        }
+    )
+
+
+def _format_reasons(reasons: list[str]) -> str:
+    """Build the human readable bullet list of validation reasons."""
+    return "• " + "\n• ".join(reasons) if reasons else "Unknown issue."
+
+
+def _build_confirm_form(import_sensor: str | None, reasons: list[str]) -> dict:
+    """Return the `async_show_form` arguments for the import sensor confirmation step."""
+    return {
+        "step_id": "confirm_import_sensor",
+        "data_schema": _CONFIRM_SCHEMA,
+        "description_placeholders": {
+            "entity_id": import_sensor or "",
+            "reasons": _format_reasons(reasons),
+        },
+    }
+
+
+def _build_entry_data(user_input: dict, regions: dict[str, str], base=None) -> dict:
+    """
+    Build the config entry data for the region, scan interval and import sensor
+    in `user_input`, optionally merged over an existing entry's `base` data.
+    """
+    selected_label = user_input["tariff_code"]
+    return {
+        **(base or {}),
+        "tariff_code": regions[selected_label],
+        "tariff_region_label": selected_label,
+        "scan_interval": user_input["scan_interval"],
+        "import_sensor": user_input.get("import_sensor"),
+        "product_url": PRODUCT_URL,
+    }
+
 
 async def validate_product_url(hass: HomeAssistant) -> bool:
-    """Validate that PRODUCT_URL is reachable and returns JSON."""
-    try:
-        async with aiohttp.ClientSession() as session:
-            async with async_timeout.timeout(10):
-                resp = await session.get(PRODUCT_URL)
-                if resp.status != 200:
-                    return False
-                await resp.json()
-                return True
-    except Exception:
-        return False
+    """
+    Validate that PRODUCT_URL is reachable and returns JSON.
+
+    Shares its request (and cache) with the region lookup, so validating and
+    then fetching regions costs a single round trip.
+    """
+    reachable, _, _ = await _load_product_metadata(hass)
+    return reachable
 
 
 async def fetch_regions(hass: HomeAssistant):
     """Fetch region → tariff_code mapping from the product metadata endpoint."""
+    regions, _ = await _fetch_regions(hass)
+    return regions.copy()
+
+
+async def _fetch_regions(hass: HomeAssistant) -> tuple[dict[str, str], tuple[str, ...]]:
+    """
+    Return the region → tariff_code mapping and its sorted labels.
+
+    Falls back to `FALLBACK_REGIONS` when the API is unavailable or returns
+    no usable region codes. The returned mapping is shared and must not be
+    modified.
+    """
+    _, regions, labels = await _load_product_metadata(hass)
+    if regions:
+        return regions, labels
+    return FALLBACK_REGIONS, _FALLBACK_LABELS
+
+
+async def _load_product_metadata(
+    hass: HomeAssistant,
+) -> tuple[bool, dict[str, str], tuple[str, ...]]:
+    """
+    Fetch PRODUCT_URL once and return (reachable, regions, sorted labels).
+
+    `regions` is empty when the API could not be reached or returned no
+    usable region codes. Results with regions are cached for
+    `_REGIONS_TTL_SECONDS`; anything else is never cached.
+
+    While the circuit breaker is open the API is not contacted at all: the
+    last successful (possibly stale) result is returned, or an unreachable
+    result if there is none.
+    """
+    global _REGIONS_CACHE  # pylint: disable=global-statement
+
+    cached = _REGIONS_CACHE
+    now = time.monotonic()
+    if cached and now - cached[0] < _REGIONS_TTL_SECONDS:
+        return cached[1], cached[2], cached[3]
+
+    if now < _CB_STATE["open_until"]:
+        if cached:
+            return cached[1], cached[2], cached[3]
+        return False, {}, ()
+
     try:
-        async with aiohttp.ClientSession() as session:
-            async with async_timeout.timeout(10):
-                resp = await session.get(PRODUCT_URL)
-                data = await resp.json()
-                tariffs_section = data.get("single_register_electricity_tariffs", {})
-                if not tariffs_section:
-                    raise ValueError("No tariffs in API response")
-                regions: dict[str, str] = {}
-                for item in tariffs_section.values():
-                    ddm = item.get("direct_debit_monthly")
-                    if ddm and "code" in ddm:
-                        code = ddm["code"]
-                        region_letter = code.split("-")[-1]
-                        for label, fallback_code in FALLBACK_REGIONS.items():
-                            if fallback_code.endswith(region_letter):
-                                regions[label] = code
-                                break
-                if not regions:
-                    raise ValueError("API returned no usable region codes")
-                return regions
+        data = await _get_product_json(async_get_clientsession(hass))
     except Exception:  # pylint: disable=broad-except
-        # Fallback if API fails
-        return FALLBACK_REGIONS.copy()
+        _CB_STATE["failures"] += 1
+        if _CB_STATE["failures"] >= _CB_THRESHOLD:
+            _CB_STATE["open_until"] = time.monotonic() + _CB_COOLDOWN_SECONDS
+        return False, {}, ()
+
+    _CB_STATE["failures"] = 0
+    regions = _parse_regions(data)
+    if not regions:
+        return True, {}, ()
+
+    # The API normally returns exactly the standard regions, whose sorted
+    # labels are already known; only sort a genuinely different set.
+    if regions.keys() == FALLBACK_REGIONS.keys():
+        labels = _FALLBACK_LABELS
+    else:
+        labels = tuple(sorted(regions))
+    _REGIONS_CACHE = (time.monotonic(), True, regions, labels)
+    return True, regions, labels
+
+
+def _parse_regions(data) -> dict[str, str]:
+    """Extract the region label → tariff_code mapping from product metadata."""
+    tariffs_section = (
+        data.get("single_register_electricity_tariffs") if isinstance(data, dict) else None
+    )
+    if not isinstance(tariffs_section, dict):
+        return {}
+
+    regions: dict[str, str] = {}
+    # Stop as soon as every known region letter has been matched, however
+    # many other product variants the section carries.
+    remaining = set(FALLBACK_BY_LETTER)
+    for item in tariffs_section.values():
+        ddm = item.get("direct_debit_monthly") if isinstance(item, dict) else None
+        if ddm and "code" in ddm:
+            code = ddm["code"]
+            region_letter = code.rpartition("-")[2]
+            label = FALLBACK_BY_LETTER.get(region_letter)
+            if label:
+                regions[label] = code
+                remaining.discard(region_letter)
+                if not remaining:
+                    break
+    return regions
+
+
+async def _get_product_json(session: aiohttp.ClientSession):
+    """
+    Fetch and decode PRODUCT_URL, retrying once on a transient error.
+
+    Only connection errors, timeouts and 5xx responses are retried, after a
+    short jittered exponential backoff; anything else (including 4xx
+    responses) propagates immediately.
+    """
+    for attempt in range(_FETCH_ATTEMPTS):
+        try:
+            async with async_timeout.timeout(_FETCH_TIMEOUT_SECONDS):
+                resp = await session.get(PRODUCT_URL)
+                resp.raise_for_status()
+                return json_loads(await resp.read())
+        except aiohttp.ClientResponseError as err:
+            if err.status < 500 or attempt == _FETCH_ATTEMPTS - 1:
+                raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == _FETCH_ATTEMPTS - 1:
+                raise
+        await asyncio.sleep(0.25 * (2**attempt) + random.random() * 0.1)
+    return None
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[misc]
@@ -136,8 +316,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[misc
         errors: dict[str, str] = {}
 
         # Fetch region list for the form
-        self._regions = await fetch_regions(self.hass)
-        region_labels = sorted(self._regions.keys())
+        self._regions, region_labels = await _fetch_regions(self.hass)
 
         if user_input is not None:
             # If an import sensor was provided, validate it (soft validation)
@@ -149,29 +328,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[misc
                     return await self.async_step_confirm_import_sensor({"user_input": user_input, "reasons": reasons})  # pylint: disable=line-too-long
 
             # If validation passed or no import sensor provided, create the entry
-            selected_label = user_input["tariff_code"]
-            tariff_code = self._regions[selected_label]
             return self.async_create_entry(
-                title=f"EDF FreePhase Dynamic Tariff ({selected_label})",
-                data={
-                    "tariff_code": tariff_code,
-                    "tariff_region_label": selected_label,
-                    "scan_interval": user_input["scan_interval"],
-                    "import_sensor": user_input.get("import_sensor"),
-                    "product_url": PRODUCT_URL,
-                },
+                title=f"EDF FreePhase Dynamic Tariff ({user_input['tariff_code']})",
+                data=_build_entry_data(user_input, self._regions),
             )
 
-        data_schema = vol.Schema(
-            {
-                vol.Required("tariff_code"): selector({"select": {"options": region_labels}}),
-                vol.Required("scan_interval", default=30): selector({"number": {"min": 1, "max": 120, "step": 1}}),  # pylint: disable=line-too-long
-                vol.Optional("import_sensor"): selector({"entity": {"domain": "sensor"}}),
-            }
+        return self.async_show_form(
+            step_id="user", data_schema=_user_schema(region_labels), errors=errors
         )
 
-        return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
-
     async def async_step_confirm_import_sensor(self, data):
         """
         Confirmation step shown when the selected import sensor fails validation.
@@ -184,33 +349,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):  # type: ignore[misc
 
         # If the user confirmed, create the entry regardless of validation warnings
         if user_input and user_input.get("confirm_import_sensor"):
-            selected_label = user_input["tariff_code"]
-            tariff_code = self._regions[selected_label]
             return self.async_create_entry(
-                title=f"EDF FreePhase Dynamic Tariff ({selected_label})",
-                data={
-                    "tariff_code": tariff_code,
-                    "tariff_region_label": selected_label,
-                    "scan_interval": user_input["scan_interval"],
-                    "import_sensor": import_sensor,
-                    "product_url": PRODUCT_URL,
-                },
+                title=f"EDF FreePhase Dynamic Tariff ({user_input['tariff_code']})",
+                data=_build_entry_data(user_input, self._regions),
             )
 
-        # Build a human readable reasons string for the form description
-        reason_text = "\n".join(f"• {r}" for r in reasons) if reasons else "Unknown issue."
-
-        data_schema = vol.Schema(
-            {
-                vol.Required("confirm_import_sensor", default=False): bool,
-            }
-        )
-
-        return self.async_show_form(
-            step_id="confirm_import_sensor",
-            data_schema=data_schema,
-            description_placeholders={"entity_id": import_sensor or "", "reasons": reason_text},
-        )
+        return self.async_show_form(**_build_confirm_form(import_sensor, reasons))
 
     @staticmethod
     def async_get_options_flow(config_entry):
@@ -226,28 +370,26 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     def __init__(self, config_entry):
         self._config_entry = config_entry
+        self._regions: dict[str, str] | None = None
 
     async def async_step_init(self, user_input=None):
         """Show the options form and validate import sensor if provided."""
         errors: dict[str, str] = {}
 
-        regions = await fetch_regions(self.hass)
-        region_labels = sorted(regions.keys())
-
-        current_tariff_code = self._config_entry.data.get("tariff_code")
-        current_region_label = None
-        for label, code in regions.items():
-            if code == current_tariff_code:
-                current_region_label = label
-                break
+        regions, region_labels = await _fetch_regions(self.hass)
+        self._regions = regions
 
         current_scan = self._config_entry.data.get("scan_interval", 30)
         current_import_sensor = self._config_entry.data.get("import_sensor")
-        stored_region_label = self._config_entry.data.get("tariff_region_label")
-        if stored_region_label:
-            current_region_label = stored_region_label
-        elif current_region_label is None:
-            current_region_label = region_labels[0]
+
+        # Entries store their region label since first setup; only legacy
+        # entries need the reverse lookup from tariff code.
+        current_region_label = self._config_entry.data.get("tariff_region_label")
+        if not current_region_label:
+            current_tariff_code = self._config_entry.data.get("tariff_code")
+            current_region_label = {code: label for label, code in regions.items()}.get(
+                current_tariff_code, region_labels[0]
+            )
 
         if user_input is not None:
             import_sensor = user_input.get("import_sensor")
@@ -258,16 +400,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     return await self.async_step_confirm_import_sensor({"user_input": user_input, "reasons": reasons})  # pylint: disable=line-too-long
 
             # Apply changes
-            selected_label = user_input["tariff_code"]
-            tariff_code = regions[selected_label]
-            new_data = {
-                **self._config_entry.data,
-                "tariff_code": tariff_code,
-                "tariff_region_label": selected_label,
-                "scan_interval": user_input["scan_interval"],
-                "import_sensor": user_input.get("import_sensor"),
-                "product_url": PRODUCT_URL,
-            }
+            new_data = _build_entry_data(user_input, regions, base=self._config_entry.data)
             self.hass.config_entries.async_update_entry(self._config_entry, data=new_data)
 
             # This ensures: `entry.data` holds the core config & `entry.options` holds the debug flag
@@ -280,19 +413,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         # Build the options form
         data_schema = vol.Schema(
             {
-                vol.Required("tariff_code", default=current_region_label): selector(
-                    {"select": {"options": region_labels}}
-                ),
-                vol.Required("scan_interval", default=current_scan): selector(
-                    {"number": {"min": 1, "max": 120, "step": 1}}
-                ),
-                vol.Optional("import_sensor", default=current_import_sensor): selector(
-                    {"entity": {"domain": "sensor"}}
+                vol.Required("tariff_code", default=current_region_label): (
+                    _make_region_selector(region_labels)
                 ),
+                vol.Required("scan_interval", default=current_scan): _SCAN_SELECTOR,
+                vol.Optional("import_sensor", default=current_import_sensor): _SENSOR_SELECTOR,
                 vol.Optional(
                     "debug_logging",
                     default=self._config_entry.options.get("debug_logging", False),
-                ): selector({"boolean": {}}),
+                ): _BOOL_SELECTOR,
             }
         )
 
@@ -305,18 +434,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         import_sensor = user_input.get("import_sensor")
 
         if user_input and user_input.get("confirm_import_sensor"):
-            # Apply changes even though validation warned
-            regions = await fetch_regions(self.hass)
-            selected_label = user_input["tariff_code"]
-            tariff_code = regions[selected_label]
-            new_data = {
-                **self._config_entry.data,
-                "tariff_code": tariff_code,
-                "tariff_region_label": selected_label,
-                "scan_interval": user_input["scan_interval"],
-                "import_sensor": import_sensor,
-                "product_url": PRODUCT_URL,
-            }
+            # Apply changes even though validation warned, reusing the
+            # regions fetched for the form that led here
+            regions = self._regions or (await _fetch_regions(self.hass))[0]
+            new_data = _build_entry_data(user_input, regions, base=self._config_entry.data)
             self.hass.config_entries.async_update_entry(self._config_entry, data=new_data)
 
             # Ensures the debug flag is preserved even when the user confirms a failing sensor
@@ -325,12 +446,4 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 data={"debug_logging": user_input.get("debug_logging", False)},
             )
 
-        reason_text = "\n".join(f"• {r}" for r in reasons) if reasons else "Unknown issue."
-
-        data_schema = vol.Schema({vol.Required("confirm_import_sensor", default=False): bool})
-
-        return self.async_show_form(
-            step_id="confirm_import_sensor",
-            data_schema=data_schema,
-            description_placeholders={"entity_id": import_sensor or "", "reasons": reason_text},
-        )
+        return self.async_show_form(**_build_confirm_form(import_sensor, reasons))
@@ -83,22 +83,35 @@ state and coordinator health.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime, timezone
-from time import monotonic
+from itertools import accumulate
+from operator import attrgetter
+from time import monotonic, monotonic_ns, time
+from types import MappingProxyType
 
 # pylint: disable=import-error
+import aiohttp  # pyright: ignore[reportMissingImports]
+import async_timeout  # pyright: ignore[reportMissingImports]
 from homeassistant.config_entries import ConfigEntry  # pyright: ignore[reportMissingImports]
+from homeassistant.helpers.aiohttp_client import async_get_clientsession  # pyright: ignore[reportMissingImports]
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator  # pyright: ignore[reportMissingImports]
 # pylint: enable=import-error
 
-from .api.client import fetch_all_pages
-from .api.parsing import build_forecasts, build_unified_dataset, strip_internal
+from .api.client import NotModified, fetch_all_pages, iter_pages, json_loads
+from .api.parsing import (
+    build_normalised_forecasts,
+    build_unified_dataset_stream,
+    forecast_bounds,
+    normalise_unified_slot,
+)
 from .api.scheduler import AlignedScheduler
 from .const import DOMAIN
 from .helpers import (
     extract_tariff_metadata,
-    find_current_block,
     format_phase_block,
     group_phase_blocks,
     normalise_slot,
@@ -106,7 +119,16 @@ from .helpers import (
 
 _LOGGER = logging.getLogger(__name__)
 
-HEARTBEAT_PRIORITY = [
+_slot_start = attrgetter("start_dt")
+
+# Product metadata is effectively static, so it is refetched at most this often.
+_PRODUCT_TTL_SECONDS = 12 * 60 * 60
+
+# Standing charges are cached until their `valid_to`; open-ended charges
+# (valid_to is null) are rechecked after this long.
+_STANDING_TTL_SECONDS = 6 * 60 * 60
+
+HEARTBEAT_PRIORITY = (
     "api_error",
     "no_data",
     "parsing_error",
@@ -121,7 +143,82 @@ HEARTBEAT_PRIORITY = [
     "stale",
     "partial",
     "healthy",
-]
+)
+
+
+def _heartbeat_flags(
+    *,
+    metadata_error: bool = False,
+    api_error: bool = False,
+    no_data: bool = False,
+    unexpected_format: bool = False,
+    stale: bool = False,
+    partial: bool = False,
+    standing_charge_error: bool = False,
+    standing_charge_missing: bool = False,
+) -> dict[str, bool]:
+    """
+    Build the heartbeat flag dictionary included in every dataset.
+
+    Flags the coordinator never raises itself (parsing_error, rate_limited,
+    scheduler_error and the import-sensor flags) are always False here.
+    """
+
+    return {
+        "metadata_error": metadata_error,
+        "api_error": api_error,
+        "no_data": no_data,
+        "parsing_error": False,
+        "unexpected_format": unexpected_format,
+        "rate_limited": False,
+        "scheduler_error": False,
+        "import_sensor_missing": False,
+        "import_sensor_unavailable": False,
+        "stale": stale,
+        "partial": partial,
+        "standing_charge_error": standing_charge_error,
+        "standing_charge_missing": standing_charge_missing,
+    }
+
+
+def _standing_error(error: str, raw=None) -> dict:
+    """Build the standing-charges result for a failed fetch or parse."""
+
+    return {
+        "value_inc_vat": None,
+        "value_exc_vat": None,
+        "valid_from": None,
+        "valid_to": None,
+        "raw": raw,
+        "error": error,
+    }
+
+
+def _debug_noop(*_args) -> None:
+    """Stand-in for `EDFCoordinator.debug` while debug logging is disabled."""
+
+
+# Scalar fields of the dataset returned when a refresh fails; the slot-list
+# fields are listed separately so every failure gets fresh empty lists.
+_FAILURE_TEMPLATE = MappingProxyType(
+    {
+        "current_price": None,
+        "next_price": None,
+        "current_slot": None,
+        "current_block_summary": None,
+        "next_block_summary": None,
+        "api_latency_ms": None,
+        "last_updated": None,
+        "coordinator_status": "api_error",
+    }
+)
+_FAILURE_LIST_KEYS = (
+    "next_24_hours",
+    "today_24_hours",
+    "tomorrow_24_hours",
+    "yesterday_24_hours",
+    "all_slots_sorted",
+)
 
 
 class EDFCoordinator(DataUpdateCoordinator):
@@ -150,37 +247,53 @@ class EDFCoordinator(DataUpdateCoordinator):
         self.standing_charges_url = standing_charges_url
         self._scan_interval = scan_interval
 
-        # Rolling debug buffer
-        self.debug_buffer = []
-        self.debug_times = []
+        # The interval is fixed for the coordinator's lifetime, so the values
+        # derived from it on every refresh are computed once here.
+        self._scan_interval_seconds: int = int(scan_interval.total_seconds())
+        self._stale_after_seconds: float = scan_interval.total_seconds() * 2
+
+        # Home Assistant's shared aiohttp session keeps connections to the
+        # EDF API warm between refreshes and across pagination requests.
+        self._session = async_get_clientsession(hass)
+
+        # Rolling debug buffer (the deques drop their oldest entry themselves)
+        self.debug_buffer: deque[str] = deque(maxlen=10)
+        # Epoch seconds per entry; formatted only when `debug_times` is read
+        self._debug_stamps: deque[float] = deque(maxlen=10)
 
         self.config_entry: ConfigEntry | None = None
 
         self.scheduler = AlignedScheduler(hass, scan_interval)
 
-        self._next_boundary_utc = None
-        self._next_refresh_datetime = None
         self._next_refresh_delay = None
         self._next_refresh_jitter = None
 
-        self._debug = self.hass.data[DOMAIN].get("debug_enabled", False)
-        self.debug_counter = 0
+        # Last successfully built unified dataset and the HTTP cache
+        # validators (etag / last_modified) of the response it came from.
+        # While both are held, unit rates are requested conditionally and a
+        # 304 reuses the dataset instead of re-downloading and re-parsing it.
+        self._unified_cache: list | None = None
+        self._rates_validators: dict[str, str] = {}
 
-        # Inline debug wrapper (WORKING VERSION)
-        def debug(msg, *args):
-            if self.debug_enabled:
-                formatted = msg % args if args else msg
-                timestamp = datetime.now(timezone.utc).isoformat()
+        # `now` of the last successful refresh (the datetime behind the
+        # dataset's `last_updated` string), used for stale detection.
+        self._last_updated_dt: datetime | None = None
 
-                self.debug_buffer.append(formatted)
-                self.debug_times.append(timestamp)
-                if len(self.debug_buffer) > 10:
-                    self.debug_buffer.pop(0)
-                    self.debug_times.pop(0)
+        # Phase blocks grouped from the current snapshot's slot lists, keyed
+        # by the list's id(); see `cached_phase_blocks()`.
+        self._cached_phase_blocks: dict[int, tuple[list, list, dict[int, int]]] = {}
 
-                _LOGGER.info("EDF INT. EC | %s", formatted)
+        # Product metadata and standing charges rarely change; successful
+        # fetches are reused until `expires` (a monotonic() timestamp).
+        self._meta_cache = {"data": None, "expires": 0.0}
+        self._standing_cache = {"data": None, "expires": 0.0}
 
-        self.debug = debug
+        self._debug = self.hass.data[DOMAIN].get("debug_enabled", False)
+        self.debug_counter = 0
+
+        # `self.debug` is the real logger while debug logging is enabled and
+        # a no-op otherwise, so disabled call sites skip all formatting work.
+        self.debug = self._debug_log if self._debug else _debug_noop
 
         super().__init__(
             hass,
@@ -213,34 +326,25 @@ class EDFCoordinator(DataUpdateCoordinator):
         url = self.standing_charges_url
 
         try:
-            from aiohttp import ClientSession  # pyright: ignore[reportMissingImports] # pylint: disable=import-error disable=import-outside-toplevel # noqa: I001
-            import async_timeout  # pyright: ignore[reportMissingImports] # pylint: disable=import-error  disable=import-outside-toplevel # noqa: I001
-
-            async with ClientSession() as session:
-                async with async_timeout.timeout(15):
-                    resp = await session.get(url)
-
-                    if resp.status != 200:
-                        return {
-                            "value_inc_vat": None,
-                            "value_exc_vat": None,
-                            "valid_from": None,
-                            "valid_to": None,
-                            "raw": None,
-                            "error": f"HTTP {resp.status}",
-                        }
-
-                    data = await resp.json()
+            # The response is used as a context manager so its pooled
+            # connection goes straight back to the shared session.
+            async with async_timeout.timeout(15), self._session.get(url) as resp:
+                if resp.status != 200:
+                    return _standing_error(f"HTTP {resp.status}")
+
+                # Decode the raw body directly: orjson parses bytes, so this
+                # skips aiohttp's intermediate decode to str.
+                data = json_loads(await resp.read())
+
+        # Timeouts, connection errors and undecodable bodies are the expected
+        # failures; they are reported without a traceback.
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.debug("EDF INT. EC: Standing charges fetch failed: %r", err)
+            return _standing_error(str(err))
 
         except Exception as err:  # pylint: disable=broad-except
-            return {
-                "value_inc_vat": None,
-                "value_exc_vat": None,
-                "valid_from": None,
-                "valid_to": None,
-                "raw": None,
-                "error": str(err),
-            }
+            _LOGGER.warning("EDF INT. EC: Unexpected standing charges fetch error: %r", err)
+            return _standing_error(str(err))
 
         # Expected EDF format:
         # {
@@ -269,14 +373,82 @@ class EDFCoordinator(DataUpdateCoordinator):
             }
 
         except Exception as err:  # pylint: disable=broad-except
-            return {
-                "value_inc_vat": None,
-                "value_exc_vat": None,
-                "valid_from": None,
-                "valid_to": None,
-                "raw": data,
-                "error": f"parse_error: {err}",
-            }
+            return _standing_error(f"parse_error: {err}", data)
+
+    async def _async_fetch_product_raw(self):
+        """Return the raw product metadata, from cache while it is fresh."""
+        cache = self._meta_cache
+        if cache["data"] is not None and monotonic() < cache["expires"]:
+            self.debug("Using cached product metadata")
+            return cache["data"]
+
+        product_raw = await fetch_all_pages(self.product_url, max_pages=1, session=self._session)
+        # fetch_all_pages() signals failure with an empty result
+        if product_raw:
+            cache["data"] = product_raw
+            cache["expires"] = monotonic() + _PRODUCT_TTL_SECONDS
+        return product_raw
+
+    async def _async_standing_charges(self, now: datetime) -> dict:
+        """
+        Return the standing charges, from cache until they expire.
+
+        A successful fetch is cached until its `valid_to` timestamp, or for
+        `_STANDING_TTL_SECONDS` when the charge is open-ended.
+        """
+        cache = self._standing_cache
+        if cache["data"] is not None and monotonic() < cache["expires"]:
+            self.debug("Using cached standing charges")
+            return cache["data"]
+
+        standing = await self.async_fetch_standing_charges()
+        if standing["error"] or standing["value_inc_vat"] is None:
+            return standing
+
+        ttl = _STANDING_TTL_SECONDS
+        valid_to = standing.get("valid_to")
+        if valid_to:
+            try:
+                ttl = (datetime.fromisoformat(valid_to) - now).total_seconds()
+            except (TypeError, ValueError):
+                pass
+
+        if ttl > 0:
+            cache["data"] = standing
+            cache["expires"] = monotonic() + ttl
+        return standing
+
+    def _debug_log(self, msg, *args) -> None:
+        """Record a debug message in the rolling buffer and log it."""
+        formatted = msg % args if args else msg
+
+        self.debug_buffer.append(formatted)
+        self._debug_stamps.append(time())
+
+        _LOGGER.info("EDF INT. EC | %s", formatted)
+
+    def cached_phase_blocks(self, slots: list[dict]) -> tuple[list[list[dict]], dict[int, int]]:
+        """
+        Return `group_phase_blocks(slots)` for a slot list of the current snapshot.
+
+        Alongside the blocks, returns a mapping of `id(block[0])` to the
+        block's index, so the block following a known one is found without
+        scanning the block list. The cache is emptied on every successful
+        refresh; each entry also holds on to `slots` so its id() cannot be
+        reused while the entry exists.
+        """
+
+        entry = self._cached_phase_blocks.get(id(slots))
+        if entry is None or entry[0] is not slots:
+            blocks = group_phase_blocks(slots)
+            entry = (slots, blocks, {id(block[0]): i for i, block in enumerate(blocks)})
+            self._cached_phase_blocks[id(slots)] = entry
+        return entry[1], entry[2]
+
+    @property
+    def debug_times(self) -> list[str]:
+        """ISO timestamps matching the entries in `debug_buffer`."""
+        return [datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() for ts in self._debug_stamps]
 
     @property
     def debug_enabled(self) -> bool:
@@ -294,52 +466,58 @@ class EDFCoordinator(DataUpdateCoordinator):
             _LOGGER.error("EDFCoordinator: config_entry not attached before refresh")
             return {}
 
-        # Refresh debug flag
+        # Refresh debug flag and swap the debug wrapper to match
         self._debug = self.config_entry.options.get("debug_logging", False)
-
-        # Rebind wrapper so it sees updated flag
-        def debug(msg, *args):
-            if self.debug_enabled:
-                formatted = msg % args if args else msg
-                timestamp = datetime.now(timezone.utc).isoformat()
-                self.debug_buffer.append(formatted)
-                self.debug_times.append(timestamp)
-                if len(self.debug_buffer) > 10:
-                    self.debug_buffer.pop(0)
-                    self.debug_times.pop(0)
-                _LOGGER.info("EDF INT. EC | %s", formatted)
-
-        self.debug = debug
+        self.debug = self._debug_log if self._debug else _debug_noop
 
         if self._debug:
             self.debug_counter += 1
 
         self.debug("Starting _async_update_data")
 
-        start_time = monotonic()
+        start_ns = monotonic_ns()
         now = datetime.now(timezone.utc)
         now_iso = now.isoformat()
 
-        flags = {
-            "metadata_error": False,
-            "api_error": False,
-            "no_data": False,
-            "parsing_error": False,
-            "unexpected_format": False,
-            "rate_limited": False,
-            "scheduler_error": False,
-            "import_sensor_missing": False,
-            "import_sensor_unavailable": False,
-            "stale": False,
-            "partial": False,
-            "standing_charge_error": False,
-            "standing_charge_missing": False,
-        }
+        # Heartbeat flags are plain locals while the refresh runs and are
+        # assembled into the flag dict once, by `_heartbeat_flags()`.
+        metadata_error = False
+        no_data = False
+        unexpected_format = False
+        stale = False
+
+        # The three requests are independent, so run them concurrently; the
+        # refresh then takes as long as the slowest one rather than the sum.
+        # Unit-rate pages are still parsed as they arrive, overlapping
+        # parsing with the fetch of the remaining pages.
+        self.debug(
+            "Fetching product metadata from %s, standing charges from %s and unit rates from %s",
+            self.product_url,
+            self.standing_charges_url,
+            self.api_url,
+        )
+        # Validators are collected into a copy and only kept once the whole
+        # dataset has been built, so a failed refresh cannot pair new
+        # validators with the old cached dataset.
+        validators = dict(self._rates_validators) if self._unified_cache is not None else {}
+        product_raw, standing, unified = await asyncio.gather(
+            self._async_fetch_product_raw(),
+            self._async_standing_charges(now),
+            build_unified_dataset_stream(
+                iter_pages(self._session, self.api_url, max_pages=3, validators=validators)
+            ),
+            return_exceptions=True,
+        )
+        for result in (product_raw, standing, unified):
+            # Only ordinary errors are handled per fetch; cancellation and
+            # other BaseExceptions must still propagate.
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
 
         # 1. Product metadata
         try:
-            self.debug("Fetching product metadata from %s", self.product_url)
-            product_raw = await fetch_all_pages(self.product_url, max_pages=1)  # pyright: ignore[reportGeneralTypeIssues]
+            if isinstance(product_raw, Exception):
+                raise product_raw
             self.debug("Product metadata fetch complete")
 
             if isinstance(product_raw, dict):
@@ -358,22 +536,21 @@ class EDFCoordinator(DataUpdateCoordinator):
 
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOGGER.warning("EDF INT. EC: Failed to fetch or parse product metadata: %s", err)
-            flags["metadata_error"] = True
+            metadata_error = True
             tariff_metadata = {}
 
         # --------------------------------------------------------------
         # NEW: Standing charges fetch
         # --------------------------------------------------------------
-        self.debug("Fetching standing charges from %s", self.standing_charges_url)
-        standing = await self.async_fetch_standing_charges()
+        if isinstance(standing, Exception):
+            standing = _standing_error(str(standing))
 
-        if standing["error"]:
-            flags["standing_charge_error"] = True
-            flags["standing_charge_missing"] = True
+        standing_charge_error = bool(standing["error"])
+        if standing_charge_error:
+            standing_charge_missing = True
             self.debug("Standing charge fetch failed: %s", standing["error"])
         else:
-            flags["standing_charge_error"] = False
-            flags["standing_charge_missing"] = standing["value_inc_vat"] is None
+            standing_charge_missing = standing["value_inc_vat"] is None
             self.debug(
                 "Standing charges fetched: inc_vat=%s exc_vat=%s",
                 standing.get("value_inc_vat"),
@@ -381,49 +558,55 @@ class EDFCoordinator(DataUpdateCoordinator):
             )
 
         # 2. Unit rates + unified dataset
-        try:
-            self.debug("Fetching unit rates from %s", self.api_url)
-            raw_items = await fetch_all_pages(self.api_url, max_pages=3) # pyright: ignore[reportGeneralTypeIssues]
-            self.debug("Fetched %d raw unit-rate items", len(raw_items) if isinstance(raw_items, list) else -1)  # pylint: disable=line-too-long
-
-            if not isinstance(raw_items, list):
-                flags["unexpected_format"] = True
-                raise ValueError("EDF API returned unexpected structure")
-
-            if not all(isinstance(i, dict) for i in raw_items):
-                flags["unexpected_format"] = True
-                raise ValueError("EDF API returned unexpected structure")
+        if isinstance(unified, NotModified):
+            self.debug("Unit rates not modified, reusing cached dataset")
+            unified = self._unified_cache
 
-            if not raw_items:
-                flags["no_data"] = True
+        try:
+            if isinstance(unified, TypeError):
+                unexpected_format = True
+                raise ValueError("EDF API returned unexpected structure") from unified
+            if isinstance(unified, Exception):
+                raise unified
+
+            if not unified:
+                no_data = True
                 raise ValueError("EDF API returned no results")
 
-            unified = build_unified_dataset(raw_items)
-            self.debug("Unified dataset built: %d slots", len(unified))
+            # `unified` is known to be a non-empty list here; its length is
+            # taken once and reused below.
+            slot_count = len(unified)
+            self._unified_cache = unified
+            self._rates_validators = validators
+            self.debug("Unified dataset built: %d slots", slot_count)
 
-            forecasts = build_forecasts(unified, now)
+            bounds = forecast_bounds(unified, now)
             self.debug(
                 "Forecasts built: next=%d today=%d tomorrow=%d yesterday=%d",
-                len(forecasts["next_24_hours"]),
-                len(forecasts["today_24_hours"]),
-                len(forecasts["tomorrow_24_hours"]),
-                len(forecasts["yesterday_24_hours"]),
+                *(stop - start for start, stop in (
+                    bounds["next_24_hours"],
+                    bounds["today_24_hours"],
+                    bounds["tomorrow_24_hours"],
+                    bounds["yesterday_24_hours"],
+                )),
             )
 
-            # Current slot
-            current_raw = next(
-                (slot for slot in unified if slot["_start_dt_obj"] <= now < slot["_end_dt_obj"]),
-                None,
-            )
+            # `unified` is sorted by start, so a single bisection locates both
+            # the current slot (the last one starting at or before now) and
+            # the next one.
+            i_next = bisect_right(unified, now, key=_slot_start)
+            current_raw = None
+            if i_next and now < unified[i_next - 1].end_dt:
+                current_raw = unified[i_next - 1]
 
             if current_raw:
                 self.debug("Current slot found")
-                current_slot = normalise_slot(strip_internal([current_raw])[0])
+                current_slot = normalise_unified_slot(current_raw)
                 current_price = current_slot["value"]
             else:
                 self.debug("No current slot found, falling back to first slot")
                 first = unified[0]
-                current_price = first["value"]
+                current_price = first.value
                 current_slot = normalise_slot(
                     {
                         "start": None,
@@ -431,64 +614,63 @@ class EDFCoordinator(DataUpdateCoordinator):
                         "start_dt": None,
                         "end_dt": None,
                         "value": current_price,
-                        "phase": first["phase"],
+                        "phase": first.phase,
                         "currency": "GBP",
                     }
                 )
 
-            next_price = next(
-                (slot["value"] for slot in unified if slot["_start_dt_obj"] > now),
-                None,
-            )
+            next_price = unified[i_next].value if i_next < slot_count else None
             self.debug("Next price determined: %s", next_price)
 
-            all_slots_sorted = [normalise_slot(slot) for slot in strip_internal(unified)]
+            normalised = build_normalised_forecasts(unified, bounds)
+            all_slots_sorted = normalised["all_slots_sorted"]
             self.debug("Normalised all slots: %d", len(all_slots_sorted))
 
-            next_24_hours = [normalise_slot(slot) for slot in strip_internal(forecasts["next_24_hours"])]  # pylint: disable=line-too-long
-            today_24_hours = [normalise_slot(slot) for slot in strip_internal(forecasts["today_24_hours"])]  # pylint: disable=line-too-long
-            tomorrow_24_hours = [normalise_slot(slot) for slot in strip_internal(forecasts["tomorrow_24_hours"])]  # pylint: disable=line-too-long
-            yesterday_24_hours = [normalise_slot(slot) for slot in strip_internal(forecasts["yesterday_24_hours"])]  # pylint: disable=line-too-long
-
-            current_block = find_current_block(all_slots_sorted, current_slot)
-            blocks = group_phase_blocks(all_slots_sorted)
-
-            next_block = None
-            if current_block and blocks:
-                try:
-                    idx = blocks.index(current_block)
-                    if idx + 1 < len(blocks):
-                        next_block = blocks[idx + 1]
-                except ValueError:
-                    next_block = None
+            next_24_hours = normalised["next_24_hours"]
+            today_24_hours = normalised["today_24_hours"]
+            tomorrow_24_hours = normalised["tomorrow_24_hours"]
+            yesterday_24_hours = normalised["yesterday_24_hours"]
+
+            # A new snapshot invalidates every block grouping of the last one.
+            self._cached_phase_blocks.clear()
+
+            # Blocks partition `all_slots_sorted` in order, so the block
+            # holding the current slot is found from the cumulative block
+            # lengths and the next block is simply the following one.
+            current_block = next_block = None
+            if current_raw is not None:
+                blocks, _ = self.cached_phase_blocks(all_slots_sorted)
+                block_ends = list(accumulate(map(len, blocks)))
+                block_idx = bisect_right(block_ends, i_next - 1)
+                current_block = blocks[block_idx]
+                if block_idx + 1 < len(blocks):
+                    next_block = blocks[block_idx + 1]
 
             current_block_summary = format_phase_block(current_block) if current_block else None
             next_block_summary = format_phase_block(next_block) if next_block else None
 
-            api_latency_ms = int((monotonic() - start_time) * 1000)
+            api_latency_ms = (monotonic_ns() - start_ns) // 1_000_000
             self.debug("Block summaries computed")
 
-            # Heartbeat stale detection
-            if self.data and self.data.get("last_updated"):
-                try:
-                    last_dt = datetime.fromisoformat(self.data["last_updated"])
-                    if (now - last_dt).total_seconds() > self._scan_interval.total_seconds() * 2:
-                        flags["stale"] = True
-                        self.debug("Data marked stale")
-                except Exception:  # pylint: disable=broad-exception-caught
-                    flags["parsing_error"] = True
-
-            if flags["metadata_error"]:
-                flags["partial"] = True
-
-            primary_state = "healthy"
-            for state in HEARTBEAT_PRIORITY:
-                if flags.get(state):
-                    primary_state = state
-                    break
+            # Heartbeat stale detection, against the datetime kept from the
+            # previous successful refresh rather than reparsing last_updated
+            last_dt = self._last_updated_dt
+            if last_dt is not None and (now - last_dt).total_seconds() > self._stale_after_seconds:
+                stale = True
+                self.debug("Data marked stale")
+
+            flags = _heartbeat_flags(
+                metadata_error=metadata_error,
+                stale=stale,
+                partial=metadata_error,
+                standing_charge_error=standing_charge_error,
+                standing_charge_missing=standing_charge_missing,
+            )
+            primary_state = next((state for state in HEARTBEAT_PRIORITY if flags.get(state)), "healthy")
 
             self.debug("Primary coordinator state: %s", primary_state)
             self.debug("Returning dataset")
+            self._last_updated_dt = now
 
             return {
                 "current_price": current_price,
@@ -518,31 +700,40 @@ class EDFCoordinator(DataUpdateCoordinator):
 
         except Exception as err:  # pylint: disable=broad-exception-caught
             _LOGGER.error("EDF INT. EC: API request failed: %s", err)
-            flags["api_error"] = True
-
-            return {
-                "current_price": None,
-                "next_price": None,
-                "current_slot": None,
-                "next_24_hours": [],
-                "today_24_hours": [],
-                "tomorrow_24_hours": [],
-                "yesterday_24_hours": [],
-                "all_slots_sorted": [],
-                "current_block_summary": None,
-                "next_block_summary": None,
-                "api_latency_ms": None,
-                "last_updated": None,
-                "coordinator_status": "api_error",
-                "tariff_metadata": tariff_metadata or {},
-                "scan_interval_seconds": int(self._scan_interval.total_seconds()),
-                **flags,
-            }
+            # The failure dataset has no last_updated, so the next refresh
+            # has nothing to measure staleness against.
+            self._last_updated_dt = None
+
+            result = dict(_FAILURE_TEMPLATE)
+            for key in _FAILURE_LIST_KEYS:
+                result[key] = []
+            result["tariff_metadata"] = tariff_metadata or {}
+            result["scan_interval_seconds"] = self._scan_interval_seconds
+            result.update(
+                _heartbeat_flags(
+                    metadata_error=metadata_error,
+                    api_error=True,
+                    no_data=no_data,
+                    unexpected_format=unexpected_format,
+                    stale=stale,
+                    standing_charge_error=standing_charge_error,
+                    standing_charge_missing=standing_charge_missing,
+                )
+            )
+            return result
 
     # Scheduler sync + refresh
+    @property
+    def _next_boundary_utc(self):
+        """Next aligned boundary, built on demand by the scheduler."""
+        return self.scheduler.next_boundary_datetime
+
+    @property
+    def _next_refresh_datetime(self):
+        """Next refresh time, built on demand by the scheduler."""
+        return self.scheduler.next_refresh_datetime
+
     def _sync_scheduler_state(self) -> None:
-        self._next_boundary_utc = getattr(self.scheduler, "_next_boundary_utc", None)
-        self._next_refresh_datetime = getattr(self.scheduler, "next_refresh_datetime", None)
         self._next_refresh_delay = self.scheduler.next_refresh_delay
         self._next_refresh_jitter = getattr(self.scheduler, "next_refresh_jitter", None)
 
@@ -554,7 +745,7 @@ class EDFCoordinator(DataUpdateCoordinator):
         """
         self.debug("Performing immediate first refresh for EDF coordinator")
         await self.async_refresh()
-        await self.scheduler.schedule(self._handle_refresh)
+        self.scheduler.schedule(self._handle_refresh)
         self._sync_scheduler_state()
 
     async def _handle_refresh(self, _now=None) -> None:
@@ -565,7 +756,7 @@ class EDFCoordinator(DataUpdateCoordinator):
         :param _now: Description
         """
         self.debug("Running aligned EDF coordinator refresh")
-        await self.scheduler.schedule(self._handle_refresh)
+        self.scheduler.schedule(self._handle_refresh)
         self._sync_scheduler_state()
         await self.async_refresh()
         self.async_update_listeners()
@@ -576,4 +767,4 @@ class EDFCoordinator(DataUpdateCoordinator):
 
         :param self: Description
         """
-        await self.scheduler.shutdown()
+        self.scheduler.shutdown()
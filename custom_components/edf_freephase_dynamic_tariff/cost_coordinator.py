@@ -43,12 +43,18 @@ by Home Assistant sensor entities.
 Recorder Interaction
 --------------------
 The coordinator uses the Recorder’s supported synchronous helper
-`recorder_history.get_significant_states` via `async_add_executor_job`. This
+`recorder_history.get_significant_states`, run on the recorder's own database
+executor (`get_instance(hass).async_add_executor_job`). This
 ensures:
 • efficient database queries
 • correct handling of state transitions
 • inclusion of the state at the period start time
 
+For closed periods (yesterday) the recorder's 5‑minute statistics are used
+instead when the import sensor has them: `statistics_during_period` with the
+`change` type returns per‑bucket consumption computed in the database, so no
+state rows cross the executor boundary and no delta pass runs in Python.
+
 Delta Computation
 -----------------
 Import‑meter readings are cumulative. The coordinator:
@@ -119,13 +125,19 @@ insights for Home Assistant.
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from time import time
+from typing import Iterator, Optional
 
 # pylint: disable=import-error
+from homeassistant.components.recorder import get_instance  # pyright: ignore[reportMissingImports]
 from homeassistant.components.recorder import history as recorder_history  # pyright: ignore[reportMissingImports]
+from homeassistant.components.recorder import statistics as recorder_statistics  # pyright: ignore[reportMissingImports]
 from homeassistant.core import HomeAssistant  # pyright: ignore[reportMissingImports]
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator  # pyright: ignore[reportMissingImports]
 from homeassistant.util import dt as dt_util  # pyright: ignore[reportMissingImports]
@@ -135,8 +147,49 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_state_updated = attrgetter("last_updated")
+
+
+def _debug_noop(*_args) -> None:
+    """Stand-in for `CostCoordinator.debug` while debug logging is disabled."""
+
+
+# datetime -> isoformat() string. Slot boundaries are the same half-hour
+# marks on every update, so their strings are formatted once and reused.
+_ISO_CACHE: dict[datetime, str] = {}
+_ISO_CACHE_MAX = 4096
+
+
+def _iso(value: datetime) -> str:
+    """Return `value.isoformat()`, reusing the string for repeated datetimes."""
+    iso = _ISO_CACHE.get(value)
+    if iso is None:
+        if len(_ISO_CACHE) >= _ISO_CACHE_MAX:
+            _ISO_CACHE.clear()
+        iso = _ISO_CACHE[value] = value.isoformat()
+    return iso
+
 
-@dataclass
+@lru_cache(maxsize=512)
+def _parse_dt_str(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO timestamp string into an aware UTC datetime, or None.
+
+    Slot boundaries repeat from one update to the next, so parses are cached.
+    """
+    try:
+        dt = dt_util.parse_datetime(value)
+    except ValueError:
+        # Well-formed but out-of-range values (e.g. month 13)
+        return None
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@dataclass(slots=True)
 class SlotCost:
     """
     Docstring for SlotCost
@@ -165,25 +218,31 @@ class CostCoordinator(DataUpdateCoordinator):
         self._import_sensor = import_sensor_entity_id
         self._scan_interval = scan_interval
 
-        self.debug_buffer = []
-        self.debug_times = []
+        # Rolling debug buffer (the deques drop their oldest entry themselves)
+        self.debug_buffer: deque[str] = deque(maxlen=10)
+        # Epoch seconds per entry; formatted only when `debug_times` is read
+        self._debug_stamps: deque[float] = deque(maxlen=10)
+
+        # label -> (key, summary) of the last computed period summary; see
+        # `_cached_period_cost()`.
+        self._period_cache: dict[str, tuple[tuple, dict]] = {}
+
+        # Within one update: the latest end any period may need history for,
+        # and the (start, end, states) of the history fetched so far. Lets
+        # yesterday and today share a single recorder query.
+        self._history_fetch_end: Optional[datetime] = None
+        self._history_prefetch: Optional[tuple[datetime, datetime, list]] = None
+
+        # Set by the delta fetches: whether the recorder data used for the
+        # last computed period reaches that period's end.
+        self._period_complete = False
 
         self._debug = self.hass.data.get(DOMAIN, {}).get("debug_enabled", False)
         self.debug_counter = 0
 
-        # Inline wrapper (WORKING VERSION)
-        def debug(msg, *args):
-            if self.debug_enabled:
-                formatted = msg % args if args else msg
-                timestamp = datetime.now(timezone.utc).isoformat()
-                self.debug_buffer.append(formatted)
-                self.debug_times.append(timestamp)
-                if len(self.debug_buffer) > 10:
-                    self.debug_buffer.pop(0)
-                    self.debug_times.pop(0)
-                _LOGGER.info("EDF INT. CC | %s", formatted)
-
-        self.debug = debug
+        # `self.debug` is the real logger while debug logging is enabled and
+        # a no-op otherwise, so disabled call sites skip all formatting work.
+        self.debug = self._debug_log if self._debug else _debug_noop
 
         super().__init__(
             hass,
@@ -192,27 +251,35 @@ class CostCoordinator(DataUpdateCoordinator):
             update_interval=scan_interval,
         )
 
+    def _debug_log(self, msg, *args) -> None:
+        """Record a debug message in the rolling buffer and log it."""
+        formatted = msg % args if args else msg
+
+        self.debug_buffer.append(formatted)
+        self._debug_stamps.append(time())
+
+        _LOGGER.info("EDF INT. CC | %s", formatted)
+
+    @property
+    def debug_times(self) -> list[str]:
+        """ISO timestamps matching the entries in `debug_buffer`."""
+        return [datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() for ts in self._debug_stamps]
+
     @property
     def debug_enabled(self) -> bool:
         return self._debug
 
-    async def _async_update_data(self) -> dict:
-        self._debug = self.config_entry.options.get("debug_logging", False)
-
-        # Rebind wrapper
-        def debug(msg, *args):
-            if self.debug_enabled:
-                formatted = msg % args if args else msg
-                timestamp = datetime.now(timezone.utc).isoformat()
-                self.debug_buffer.append(formatted)
-                self.debug_times.append(timestamp)
-                if len(self.debug_buffer) > 10:
-                    self.debug_buffer.pop(0)
-                    self.debug_times.pop(0)
-                _LOGGER.info("EDF INT. CC | %s", formatted)
-
-        self.debug = debug
+    def set_debug(self, enabled: bool) -> None:
+        """
+        Enable or disable debug logging.
+
+        Called from the config entry's options update listener, so updates
+        do not need to re-read the entry options on every tick.
+        """
+        self._debug = enabled
+        self.debug = self._debug_log if enabled else _debug_noop
 
+    async def _async_update_data(self) -> dict:
         flags = {
             "history_missing": False,
             "no_deltas": False,
@@ -240,6 +307,8 @@ class CostCoordinator(DataUpdateCoordinator):
         standing_exc = edf_data.get("standing_charge_exc_vat")
         standing_from = edf_data.get("standing_charge_valid_from")
         standing_to = edf_data.get("standing_charge_valid_to")
+        # Read once here and passed down, so both periods see the same values
+        standing = (standing_inc, standing_exc, standing_from, standing_to)
 
         self.debug("yesterday_slots=%s today_slots=%s", len(yesterday_slots), len(today_slots))
 
@@ -248,15 +317,17 @@ class CostCoordinator(DataUpdateCoordinator):
             return {"yesterday": None, "today": None, "import_sensor": self._import_sensor}
 
         now = dt_util.utcnow()
+        self._history_fetch_end = now
 
         # Yesterday
         yesterday_summary = None
         if yesterday_slots:
             self.debug("Calling _compute_period_cost for yesterday")
             try:
-                yesterday_summary = await self._compute_period_cost(
+                yesterday_summary = await self._cached_period_cost(
                     slots=yesterday_slots,
                     label="yesterday",
+                    standing=standing,
                 )
             except Exception as err:  # pylint: disable=broad-exception-caught
                 _LOGGER.exception("EDF INT. CC: ERROR computing yesterday: %s", err)
@@ -268,10 +339,14 @@ class CostCoordinator(DataUpdateCoordinator):
         if today_slots:
             self.debug("Calling _compute_period_cost for today")
             try:
-                today_summary = await self._compute_period_cost(
+                # Today's history keeps growing, so its summary is only
+                # reused within the same minute.
+                today_summary = await self._cached_period_cost(
                     slots=today_slots,
                     label="today",
+                    standing=standing,
                     end_override=now,
+                    bucket=now.replace(second=0, microsecond=0),
                 )
             except Exception as err:  # pylint: disable=broad-exception-caught
                 _LOGGER.exception("EDF INT. CC: ERROR computing today: %s", err)
@@ -292,6 +367,9 @@ class CostCoordinator(DataUpdateCoordinator):
 
         coordinator_status = primary_state
 
+        # Prefetched history is only valid for this update
+        self._history_prefetch = None
+
         self.debug("EXIT _async_update_data")
 
         return {
@@ -308,12 +386,72 @@ class CostCoordinator(DataUpdateCoordinator):
             "last_updated": dt_util.utcnow().isoformat(),
         }
 
+    async def _cached_period_cost(
+        self,
+        slots: list[dict],
+        label: str,
+        standing: tuple,
+        end_override: Optional[datetime] = None,
+        bucket=None,
+    ) -> Optional[dict]:
+        """
+        Return `_compute_period_cost()` for a period, reusing the last result.
+
+        A closed period (yesterday) has immutable tariff slots and recorder
+        history, so its summary only changes when the slots, the import
+        sensor or the standing charge change; those make up the cache key.
+        Open periods pass a `bucket` (e.g. the current minute) that is added
+        to the key. Only successful summaries are cached, so a period with
+        missing history is retried on the next update.
+
+        Just after midnight the recorder may not yet have compiled the last
+        statistics bucket or committed the last states of the period that
+        has just closed, so a closed period is only cached once the data it
+        was computed from reaches the period end.
+        """
+        key = (
+            tuple(
+                (
+                    s.get("start_dt") or s.get("start"),
+                    s.get("end_dt") or s.get("end"),
+                    s.get("value"),
+                    s.get("phase"),
+                )
+                for s in slots
+            ),
+            self._import_sensor,
+            standing,
+            bucket,
+        )
+
+        cached = self._period_cache.get(label)
+        if cached is not None and cached[0] == key:
+            self.debug("Reusing cached cost summary for %s", label)
+            return cached[1]
+
+        summary = await self._compute_period_cost(
+            slots=slots,
+            label=label,
+            standing=standing,
+            end_override=end_override,
+        )
+        if summary is not None and (bucket is not None or self._period_complete):
+            self._period_cache[label] = (key, summary)
+        return summary
+
     async def _compute_period_cost(
         self,
         slots: list[dict],
         label: str,
+        standing: tuple,
         end_override: Optional[datetime] = None,
     ) -> Optional[dict]:
+        """
+        Compute the cost summary for one period.
+
+        `standing` is the (inc_vat, exc_vat, valid_from, valid_to) standing
+        charge as read once by `_async_update_data()`.
+        """
         self.debug("ENTER _compute_period_cost label=%s", label)
 
         norm_slots = []
@@ -334,6 +472,9 @@ class CostCoordinator(DataUpdateCoordinator):
                 {
                     "start": start,
                     "end": end,
+                    # Epoch seconds, converted once for sorting and alignment
+                    "start_ts": start.timestamp(),
+                    "end_ts": end.timestamp(),
                     "price_p_per_kwh": float(price),
                     "phase": phase,
                 }
@@ -345,50 +486,68 @@ class CostCoordinator(DataUpdateCoordinator):
             self.debug("No valid slots for %s cost computation", label)
             return None
 
-        norm_slots.sort(key=lambda x: x["start"])
+        norm_slots.sort(key=itemgetter("start_ts"))
         period_start = norm_slots[0]["start"]
         period_end = norm_slots[-1]["end"]
 
         self.debug("period_start=%s period_end=%s", period_start, period_end)
 
-        # Recorder: fetch significant states using the supported sync helper
-        self.debug("Calling recorder_history.get_significant_states via hass.async_add_executor_job")
-
-        def _fetch_history():
-            return recorder_history.get_significant_states(
-                self.hass,
-                period_start,
-                period_end,
-                [self._import_sensor],
-                include_start_time_state=True,
-            )
-
-        history = await self.hass.async_add_executor_job(_fetch_history)
-
-        self.debug("get_significant_states returned history=%s", history)
+        self._period_complete = False
 
-        entity_states = history.get(self._import_sensor)
-        self.debug("entity_states count=%s", len(entity_states or []))
+        # Closed periods take their deltas from the recorder's 5‑minute
+        # statistics, which are already bucketed in the database. Open
+        # periods (today) use state history: the newest statistics bucket is
+        # only compiled after it ends, so it would lag the meter.
+        deltas = None
+        if end_override is None:
+            deltas = await self._fetch_statistic_deltas(period_start, period_end)
 
-        if not entity_states:
-            self.debug("No history...")
-            return None
+        if deltas is None:
+            deltas = await self._fetch_history_deltas(period_start, period_end)
+            if deltas is None:
+                self.debug("No history...")
+                return None
 
-        # Convert cumulative kWh → deltas
-        deltas = self._compute_deltas(entity_states, period_start, period_end)
         self.debug("deltas count=%s", len(deltas))
 
         if not deltas:
             self.debug("No usable deltas...")
             return None
 
-        # Align deltas with slots
-        slot_costs: list[SlotCost] = self._align_deltas_to_slots(norm_slots, deltas)
-        self.debug("slot_costs count=%s", len(slot_costs))
+        # Align deltas with slots. Slot costs are consumed as the sweep
+        # yields them: totals, per-phase sums and the per-slot breakdown are
+        # all built in this one pass, with no intermediate list.
+        total_kwh = 0.0
+        total_cost = 0.0
+        per_phase: dict[str, list[float]] = {}  # phase -> [kwh, cost]
+        per_slot = []
 
-        total_kwh = sum(sc.kwh for sc in slot_costs)
-        total_cost = sum(sc.cost_gbp for sc in slot_costs)
+        for sc in self._align_deltas_to_slots(norm_slots, deltas):
+            kwh = sc.kwh
+            cost = sc.cost_gbp
+            total_kwh += kwh
+            total_cost += cost
 
+            phase = sc.phase or "Unknown"
+            phase_totals = per_phase.get(phase)
+            if phase_totals is None:
+                per_phase[phase] = [kwh, cost]
+            else:
+                phase_totals[0] += kwh
+                phase_totals[1] += cost
+
+            per_slot.append(
+                {
+                    "start": _iso(sc.start),
+                    "end": _iso(sc.end),
+                    "kwh": round(kwh, 4),
+                    "price_p_per_kwh": round(sc.price_p_per_kwh, 4),
+                    "cost_gbp": round(cost, 4),
+                    "phase": sc.phase,
+                }
+            )
+
+        self.debug("slot_costs count=%s", len(per_slot))
         self.debug(
             "finished period '%s' total_kwh=%s total_cost=%s",
             label,
@@ -396,36 +555,12 @@ class CostCoordinator(DataUpdateCoordinator):
             total_cost,
         )
 
-        # Aggregate per phase
-        per_phase: dict[str, dict[str, float]] = defaultdict(lambda: {"kwh": 0.0, "cost": 0.0})
-
-        for sc in slot_costs:
-            phase = sc.phase or "Unknown"
-            per_phase[phase]["kwh"] += sc.kwh
-            per_phase[phase]["cost"] += sc.cost_gbp
-
-        # Per-slot breakdown
-        per_slot = [
-            {
-                "start": sc.start.isoformat(),
-                "end": sc.end.isoformat(),
-                "kwh": round(sc.kwh, 4),
-                "price_p_per_kwh": round(sc.price_p_per_kwh, 4),
-                "cost_gbp": round(sc.cost_gbp, 4),
-                "phase": sc.phase,
-            }
-            for sc in slot_costs
-        ]
-
         self.debug("EXIT _compute_period_cost label=%s", label)
 
         # --------------------------------------------------------------
         # Standing charge cost contribution
         # --------------------------------------------------------------
-        standing_inc = self._edf_coordinator.data.get("standing_charge_inc_vat")
-        standing_exc = self._edf_coordinator.data.get("standing_charge_exc_vat")
-        standing_from = self._edf_coordinator.data.get("standing_charge_valid_from")
-        standing_to = self._edf_coordinator.data.get("standing_charge_valid_to")
+        standing_inc, standing_exc, standing_from, standing_to = standing
 
         standing_cost_gbp = None
         total_cost_including_standing = None
@@ -436,16 +571,16 @@ class CostCoordinator(DataUpdateCoordinator):
             total_cost_including_standing = round(total_cost + standing_cost_gbp, 4)
 
         return {
-            "period_start": period_start.isoformat(),
-            "period_end": period_end.isoformat(),
+            "period_start": _iso(period_start),
+            "period_end": _iso(period_end),
             "total_kwh": round(total_kwh, 4),
             "total_cost": round(total_cost, 4),
             "per_phase": {
                 phase: {
-                    "kwh": round(vals["kwh"], 4),
-                    "cost": round(vals["cost"], 4),
+                    "kwh": round(kwh, 4),
+                    "cost": round(cost, 4),
                 }
-                for phase, vals in per_phase.items()
+                for phase, (kwh, cost) in per_phase.items()
             },
             "per_slot": per_slot,
             "standing_charge_inc_vat": standing_inc,
@@ -456,24 +591,160 @@ class CostCoordinator(DataUpdateCoordinator):
             "total_cost_including_standing_gbp": total_cost_including_standing,
         }
 
+    async def _fetch_statistic_deltas(self, period_start: datetime, period_end: datetime):
+        """
+        Return per‑bucket kWh deltas from the recorder's short‑term statistics.
+
+        Uses the statistics `change` (the consumption within each 5‑minute
+        bucket, computed by the recorder) so no cumulative → delta pass is
+        needed in Python. Returns None when the import sensor has no
+        statistics for the period (e.g. it has no state_class) or only
+        mean-type statistics without a `change` (state_class `measurement`),
+        in which case the caller falls back to state history.
+        """
+        self.debug("Calling recorder_statistics.statistics_during_period via the recorder executor")
+
+        def _fetch_statistics():
+            return recorder_statistics.statistics_during_period(
+                self.hass,
+                period_start,
+                period_end,
+                {self._import_sensor},
+                "5minute",
+                None,
+                {"change"},
+            )
+
+        stats = await get_instance(self.hass).async_add_executor_job(_fetch_statistics)
+        rows = stats.get(self._import_sensor)
+        if not rows:
+            self.debug("No statistics for %s; using state history", self._import_sensor)
+            return None
+
+        deltas = []
+        has_change = False
+        for row in rows:
+            kwh = row.get("change")
+            if kwh is None:
+                continue
+            has_change = True
+            if kwh <= 0:
+                continue
+            start = self._stat_time(row.get("start"))
+            end = self._stat_time(row.get("end"))
+            if start is None or end is None or end <= start:
+                continue
+            deltas.append({"start": start, "end": end, "kwh": kwh})
+
+        if not has_change:
+            self.debug("No statistics change for %s; using state history", self._import_sensor)
+            return None
+
+        last_end = self._stat_time(rows[-1].get("end"))
+        self._period_complete = last_end is not None and last_end >= period_end
+        return deltas
+
+    async def _fetch_history_deltas(self, period_start: datetime, period_end: datetime):
+        """
+        Return kWh deltas derived from the import sensor's state history.
+
+        The first fetch of an update runs to `_history_fetch_end` (now), not
+        just to `period_end`, so when yesterday needs state history the same
+        query also covers today; later periods are then sliced from it.
+
+        Returns None when the recorder has no history for the period.
+        """
+        prefetch = self._history_prefetch
+        if prefetch is not None and prefetch[0] <= period_start and period_end <= prefetch[1]:
+            self.debug("Reusing prefetched history for %s - %s", period_start, period_end)
+            self._period_complete = self._states_reach(prefetch[2], period_end)
+            entity_states = self._slice_states(prefetch[2], period_start, period_end)
+            if not entity_states:
+                return None
+            return self._compute_deltas(entity_states, period_start, period_end)
+
+        fetch_end = self._history_fetch_end or period_end
+        if fetch_end < period_end:
+            fetch_end = period_end
+
+        # Recorder: fetch significant states using the supported sync helper
+        self.debug("Calling recorder_history.get_significant_states via the recorder executor")
+
+        def _fetch_history():
+            return recorder_history.get_significant_states(
+                self.hass,
+                period_start,
+                fetch_end,
+                [self._import_sensor],
+                include_start_time_state=True,
+                # Only the numeric state and its timestamp are used
+                no_attributes=True,
+            )
+
+        # Database work runs on the recorder's own executor, which keeps its
+        # connections open and does not compete with unrelated blocking jobs.
+        history = await get_instance(self.hass).async_add_executor_job(_fetch_history)
+
+        # Only the row count is logged: formatting the full history would
+        # repr every State on each update while debug logging is on.
+        entity_states = history.get(self._import_sensor)
+        self.debug("get_significant_states returned entity_states count=%s", len(entity_states or []))
+
+        if not entity_states:
+            return None
+
+        self._history_prefetch = (period_start, fetch_end, entity_states)
+        self._period_complete = self._states_reach(entity_states, period_end)
+        if fetch_end != period_end:
+            entity_states = self._slice_states(entity_states, period_start, period_end)
+
+        # Convert cumulative kWh → deltas
+        return self._compute_deltas(entity_states, period_start, period_end)
+
+    @staticmethod
+    def _slice_states(states: list, period_start: datetime, period_end: datetime) -> list:
+        """
+        Return the chronological `states` relevant to a period.
+
+        That is the state in effect at `period_start` (the last one updated
+        at or before it) followed by every state updated up to `period_end`,
+        matching what a history query for the period itself returns.
+        """
+        first = bisect_right(states, period_start, key=_state_updated)
+        last = bisect_right(states, period_end, key=_state_updated)
+        return states[max(first - 1, 0):last]
+
+    @staticmethod
+    def _states_reach(states: list, period_end: datetime) -> bool:
+        """
+        Return True when chronological `states` include one at or after `period_end`.
+
+        The recorder commits states in order, so a later state means every
+        state of the period before it is already in the database.
+        """
+        return bool(states) and _state_updated(states[-1]) >= period_end
+
+    @classmethod
+    def _stat_time(cls, value) -> Optional[datetime]:
+        """Parse a statistics row timestamp (epoch seconds or datetime/ISO)."""
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+        return cls._parse_dt(value)
+
     @staticmethod
     def _parse_dt(value) -> Optional[datetime]:
         """Parse a datetime-like value into an aware UTC datetime, or None."""
-        if value is None:
-            return None
         if isinstance(value, datetime):
-            if value.tzinfo is None:
+            # Slots from the EDF coordinator are already UTC
+            tzinfo = value.tzinfo
+            if tzinfo is timezone.utc:
+                return value
+            if tzinfo is None:
                 return value.replace(tzinfo=timezone.utc)
             return value.astimezone(timezone.utc)
-        try:
-            dt = dt_util.parse_datetime(value)
-            if dt is None:
-                return None
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:
-            return None
+        if isinstance(value, str):
+            return _parse_dt_str(value)
+        return None
 
     @staticmethod
     def _compute_deltas(states, period_start: datetime, period_end: datetime):
@@ -485,13 +756,15 @@ class CostCoordinator(DataUpdateCoordinator):
         prev_state = None
 
         for state in states:
+            # Recorder states carry aware UTC timestamps, so they compare
+            # directly with the period bounds without conversion.
+            ts = state.last_updated or state.last_changed
+            if ts is None:
+                continue
             try:
-                ts = state.last_updated or state.last_changed
-                if ts is None:
-                    continue
-                ts = ts.astimezone(timezone.utc)
                 value = float(state.state)
-            except Exception:
+            except (TypeError, ValueError):
+                # e.g. "unknown" / "unavailable"
                 continue
 
             if prev_state is None:
@@ -519,52 +792,71 @@ class CostCoordinator(DataUpdateCoordinator):
         return deltas
 
     @staticmethod
-    def _align_deltas_to_slots(slots: list[dict], deltas: list[dict]) -> list[SlotCost]:
-        """Distribute delta kWh across slot windows and compute costs."""
-        slot_costs: list[SlotCost] = []
+    def _align_deltas_to_slots(slots: list[dict], deltas: list[dict]) -> Iterator[SlotCost]:
+        """
+        Distribute delta kWh across slot windows and yield their costs.
+
+        `slots` must carry `start_ts`/`end_ts` epoch seconds and be sorted by
+        start (as built in `_compute_period_cost()`), and `deltas` must be
+        chronological and non‑overlapping (as produced by `_compute_deltas()`).
+        Both are then walked together in a single sweep: deltas that end
+        before the current slot starts are never revisited, and the scan for
+        a slot stops at the first delta that starts after it ends.
+
+        Slot costs are yielded in slot order, only for slots with consumption.
+        """
+        # Work in float epoch seconds (slots arrive with theirs precomputed)
+        # instead of subtracting datetimes for every slot/delta pair. Each
+        # delta is reduced to (start, end, kWh, kWh per second) so its share
+        # of a slot is simply rate * overlap.
+        delta_rates = []
+        for d in deltas:
+            d_start = d["start"].timestamp()
+            d_end = d["end"].timestamp()
+            if d_end > d_start:
+                kwh = d["kwh"]
+                delta_rates.append((d_start, d_end, kwh, kwh / (d_end - d_start)))
+
+        n_deltas = len(delta_rates)
+        first = 0
 
         for slot in slots:
-            s_start: datetime = slot["start"]
-            s_end: datetime = slot["end"]
-            price = slot["price_p_per_kwh"]
-            phase = slot.get("phase")
-
-            if (s_end - s_start).total_seconds() <= 0:
+            s0 = slot["start_ts"]
+            s1 = slot["end_ts"]
+            if s1 <= s0:
                 continue
 
-            slot_kwh = 0.0
-            for d in deltas:
-                d_start: datetime = d["start"]
-                d_end: datetime = d["end"]
-                d_kwh: float = d["kwh"]
-
-                overlap_start = max(s_start, d_start)
-                overlap_end = min(s_end, d_end)
-                overlap = (overlap_end - overlap_start).total_seconds()
+            # Slot starts only move forward, so deltas ending at or before
+            # this slot's start cannot overlap any later slot either.
+            while first < n_deltas and delta_rates[first][1] <= s0:
+                first += 1
 
-                if overlap <= 0:
-                    continue
-
-                frac = overlap / (d_end - d_start).total_seconds()
-                if frac <= 0:
+            slot_kwh = 0.0
+            k = first
+            while k < n_deltas:
+                d0, d1, kwh, rate = delta_rates[k]
+                if d0 >= s1:
+                    break
+                k += 1
+                # Meter updates usually land well inside a slot; such a
+                # delta counts in full, with no overlap arithmetic.
+                if d0 >= s0 and d1 <= s1:
+                    slot_kwh += kwh
                     continue
-
-                slot_kwh += d_kwh * frac
+                overlap = (s1 if s1 < d1 else d1) - (s0 if s0 > d0 else d0)
+                if overlap > 0:
+                    slot_kwh += rate * overlap
 
             if slot_kwh <= 0:
                 continue
 
-            cost_gbp = slot_kwh * (price / 100.0)
-
-            slot_costs.append(
-                SlotCost(
-                    start=s_start,
-                    end=s_end,
-                    kwh=slot_kwh,
-                    price_p_per_kwh=price,
-                    cost_gbp=cost_gbp,
-                    phase=phase,
-                )
+            # Output objects are only built for slots that saw consumption
+            price = slot["price_p_per_kwh"]
+            yield SlotCost(
+                start=slot["start"],
+                end=slot["end"],
+                kwh=slot_kwh,
+                price_p_per_kwh=price,
+                cost_gbp=slot_kwh * (price / 100.0),
+                phase=slot.get("phase"),
             )
-
-        return slot_costs
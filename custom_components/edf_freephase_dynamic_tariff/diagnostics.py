@@ -34,9 +34,10 @@ The diagnostics output is intentionally comprehensive and includes:
 
 5. Phase windows (grouped blocks)
    Human‑readable representations of merged phase blocks (green/amber/red)
-   generated via `group_phase_blocks()` and `format_phase_block()`. This helps
-   users and maintainers verify that the integration is correctly interpreting
-   EDF’s half‑hourly data into meaningful phase windows.
+   generated via the coordinator's cached `group_phase_blocks()` output and
+   `format_phase_block()`. This helps users and maintainers verify that the
+   integration is correctly interpreting EDF’s half‑hourly data into
+   meaningful phase windows.
 
 6. Classification thresholds
    The static rules used to classify slots into green/amber/red phases. These
@@ -89,10 +90,7 @@ from homeassistant.loader import async_get_integration  # pyright: ignore[report
 # pylint: enable=import-error
 
 from .const import DOMAIN
-from .helpers import (
-    group_phase_blocks,
-    format_phase_block,
-)
+from .helpers import format_phase_block
 
 class StandingChargeDiagnostics(TypedDict, total=False):
     """Diagnostics structure for standing charge information."""
@@ -224,8 +222,8 @@ async def async_get_config_entry_diagnostics(
         "next_refresh_datetime": getattr(coordinator, "_next_refresh_datetime", None),
         "next_refresh_delay": getattr(coordinator, "_next_refresh_delay", None),
         "next_refresh_jitter": getattr(coordinator, "_next_refresh_jitter", None),
-        # Coordinator exposes _scan_interval by design; safe to read for diagnostics.
-        "scan_interval_seconds": int(coordinator._scan_interval.total_seconds()),  # pylint: disable=protected-access
+        # Coordinator exposes _scan_interval_seconds by design; safe to read for diagnostics.
+        "scan_interval_seconds": coordinator._scan_interval_seconds,  # pylint: disable=protected-access
     }
 
     # ----------------------------------------------------------------------
@@ -242,24 +240,18 @@ async def async_get_config_entry_diagnostics(
     # ----------------------------------------------------------------------
     # Phase windows (grouped blocks)
     # ----------------------------------------------------------------------
-    yesterday_slots = coord_data.get("yesterday_24_hours") or []
-    today_slots = coord_data.get("today_24_hours") or []
-    tomorrow_slots = coord_data.get("tomorrow_24_hours") or []
-    next24_slots = coord_data.get("next_24_hours") or []
+    def _get_grouped(key: str) -> list:
+        slots = coord_data.get(key)
+        if not slots:
+            return []
+        blocks, _ = coordinator.cached_phase_blocks(slots)
+        return [format_phase_block(block) for block in blocks]
 
     diagnostics_phase_windows: PhaseWindowDiagnostics = {
-        "yesterday_phase_windows": [
-            format_phase_block(block) for block in group_phase_blocks(yesterday_slots)
-        ],
-        "today_phase_windows": [
-            format_phase_block(block) for block in group_phase_blocks(today_slots)
-        ],
-        "tomorrow_phase_windows": [
-            format_phase_block(block) for block in group_phase_blocks(tomorrow_slots)
-        ],
-        "next_24_hours_phase_windows": [
-            format_phase_block(block) for block in group_phase_blocks(next24_slots)
-        ],
+        "yesterday_phase_windows": _get_grouped("yesterday_24_hours"),
+        "today_phase_windows": _get_grouped("today_24_hours"),
+        "tomorrow_phase_windows": _get_grouped("tomorrow_24_hours"),
+        "next_24_hours_phase_windows": _get_grouped("next_24_hours"),
     }
 
     # ----------------------------------------------------------------------
@@ -325,10 +317,10 @@ async def async_get_config_entry_diagnostics(
         "last_updated": coord_data.get("last_updated"),
 
         # Debug buffers (EC + CC)
-        "ec_debug_buffer": getattr(coordinator, "debug_buffer", []),
-        "ec_debug_times": getattr(coordinator, "debug_times", []),
-        "cc_debug_buffer": getattr(data.get("cost_coordinator"), "debug_buffer", []),
-        "cc_debug_times": getattr(data.get("cost_coordinator"), "debug_times", []),
+        "ec_debug_buffer": list(getattr(coordinator, "debug_buffer", [])),
+        "ec_debug_times": list(getattr(coordinator, "debug_times", [])),
+        "cc_debug_buffer": list(getattr(data.get("cost_coordinator"), "debug_buffer", [])),
+        "cc_debug_times": list(getattr(data.get("cost_coordinator"), "debug_times", [])),
 
         # Slot + block summaries
         "current_slot": coord_data.get("current_slot"),
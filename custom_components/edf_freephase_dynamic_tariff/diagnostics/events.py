@@ -18,6 +18,7 @@ shared state and structure.
 
 from __future__ import annotations
 
+from collections import deque
 from datetime import datetime, timezone
 from typing import Dict, Any
 
@@ -52,6 +53,7 @@ class EventDiagnostics:
                 "last_event_type": None,
                 "last_event_timestamp": None,
                 "counters": {etype: 0 for etype in event_types},
+                "history": deque(maxlen=20),
             }
 
         self._store = diag_store[entry_id]
@@ -59,6 +61,12 @@ class EventDiagnostics:
         # Ensure counters always exist (defensive)
         self._store.setdefault("counters", {etype: 0 for etype in event_types})
 
+        # Rolling history (last 20 events); a bounded deque evicts the oldest
+        # entry itself. Any history left as a list is carried over.
+        history = self._store.get("history")
+        if not isinstance(history, deque):
+            self._store["history"] = deque(history or (), maxlen=20)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -77,14 +85,11 @@ class EventDiagnostics:
         self._store["last_event_payload"] = payload
 
         # Append to history (rolling 20)
-        history = self._store.setdefault("history", [])
-        history.append({
+        self._store["history"].append({
             "timestamp": now,
             "event_type": event_type,
             "payload": payload,
         })
-        if len(history) > 20:
-            history.pop(0)
 
     def get(self) -> Dict[str, Any]:
         return {
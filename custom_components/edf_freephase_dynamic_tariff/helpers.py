@@ -258,19 +258,32 @@ def group_phase_blocks(slots: list[dict]) -> list[list[dict]]:
     return blocks
 
 
+def _as_datetime(value: str | datetime | None) -> datetime | None:
+    """Return `value` unchanged if it is already a datetime, else parse it."""
+
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return parse_datetime(value)
+
+
 def format_slot_times(
-    start_raw: str | None, end_raw: str | None
+    start_raw: str | datetime | None, end_raw: str | datetime | None
 ) -> Tuple[Optional[str], Optional[str], Optional[float]]:
     """
-    Convert raw ISO timestamps into human‑readable local times and compute
+    Convert slot timestamps into human‑readable local times and compute
     duration in minutes.
 
+    Accepts either raw ISO strings or already‑parsed datetimes; the latter
+    skip the parse step entirely.
+
     Returns:
         (start_fmt, end_fmt, duration_minutes)
     """
 
-    start = parse_datetime(start_raw) if start_raw else None
-    end = parse_datetime(end_raw) if end_raw else None
+    start = _as_datetime(start_raw)
+    end = _as_datetime(end_raw)
 
     if start:
         start = as_local(start)
@@ -353,19 +366,24 @@ def format_phase_block(block: list[dict]) -> dict:
     if not block:
         return {}
 
-    start_raw = block[0].get("start")
-    end_raw = block[-1].get("end")
-    phase = block[0].get("phase")
-    price = block[0].get("value")
+    first = block[0]
+    last = block[-1]
+    phase = first.get("phase")
+    price = first.get("value")
 
-    start_fmt, end_fmt, duration = format_slot_times(start_raw, end_raw)
+    # Normalised slots already carry parsed datetimes; only fall back to the
+    # raw ISO strings when they are missing.
+    start_fmt, end_fmt, duration = format_slot_times(
+        first.get("start_dt") or first.get("start"),
+        last.get("end_dt") or last.get("end"),
+    )
 
     return {
         "phase": phase,
         "start": start_fmt,
         "end": end_fmt,
-        "start_dt": block[0].get("start_dt"),
-        "end_dt": block[-1].get("end_dt"),
+        "start_dt": first.get("start_dt"),
+        "end_dt": last.get("end_dt"),
         "duration_minutes": duration,
         **format_price_fields(price),
         "icon": icon_for_phase(phase),
@@ -745,10 +745,10 @@ class EDFFreePhaseDynamicTariffDiagnosticSensor(CoordinatorEntity, SensorEntity)
             # Event entities
             "event_diagnostics": event_section,
             # Debug buffers (10‑message rolling logs)
-            "ec_debug_buffer": self.coordinator.debug_buffer,
-            "ec_debug_times": self.coordinator.debug_times,
-            "cc_debug_buffer": self.cost_coordinator.debug_buffer,
-            "cc_debug_times": self.cost_coordinator.debug_times,
+            "ec_debug_buffer": list(self.coordinator.debug_buffer),
+            "ec_debug_times": list(self.coordinator.debug_times),
+            "cc_debug_buffer": list(self.cost_coordinator.debug_buffer),
+            "cc_debug_times": list(self.cost_coordinator.debug_times),
         }
 
     @property
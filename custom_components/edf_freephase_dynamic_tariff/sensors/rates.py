@@ -34,7 +34,6 @@ from ..helpers import (
     build_entity_id,
     edf_device_info,
     format_phase_block,
-    group_phase_blocks,
 )
 
 # ---------------------------------------------------------------------------
@@ -96,8 +95,12 @@ class _EDFFreePhaseDynamicBaseSummarySensor(CoordinatorEntity, SensorEntity):
     def _merge_blocks(self):
         """Return merged phase blocks for the configured day."""
         data = self.coordinator.data or {}
-        slots = data.get(self.day_key) or []
-        return group_phase_blocks(slots)
+        slots = data.get(self.day_key)
+        if not slots:
+            return []
+        # Grouped once per coordinator snapshot and shared with diagnostics.
+        blocks, _ = self.coordinator.cached_phase_blocks(slots)
+        return blocks
 
     # ---------------------------------------------------------------------
 
@@ -23,7 +23,8 @@ Each slot contains:
 Helpers used in this module:
     - find_current_block(): identify the merged block containing the current slot
     - find_next_phase_block(): find the next block of a specific phase
-    - group_phase_blocks(): merge consecutive slots with the same phase
+    - group_phase_blocks(): merge consecutive slots with the same phase (read
+      through the coordinator's per‑snapshot cache)
     - format_phase_block(): convert a block into a structured attribute dict
 
 Sensors included:
@@ -52,7 +53,6 @@ from ..helpers import (
     find_current_block,
     find_next_phase_block,
     format_phase_block,
-    group_phase_blocks,
 )
 
 # ---------------------------------------------------------------------------
@@ -226,7 +226,8 @@ class EDFFreePhaseDynamicNextPhaseSummarySensor(CoordinatorEntity, SensorEntity)
         Steps:
             - Retrieve all sorted slots from the coordinator.
             - Identify the current block using `find_current_block()`.
-            - Merge all slots into blocks using `group_phase_blocks()`.
+            - Merge all slots into blocks using `group_phase_blocks()`, cached
+              on the coordinator per snapshot.
             - Return the block immediately after the current one, if any.
 
         Returns:
@@ -245,13 +246,14 @@ class EDFFreePhaseDynamicNextPhaseSummarySensor(CoordinatorEntity, SensorEntity)
         if not current_block:
             return None
 
-        blocks = group_phase_blocks(all_slots)
-
-        try:
-            idx = blocks.index(current_block)
-            return blocks[idx + 1] if idx + 1 < len(blocks) else None
-        except ValueError:
+        # Blocks are grouped once per coordinator snapshot; the current
+        # block's first slot is the same dict as in `all_slots`, so its id()
+        # locates the block directly.
+        blocks, index = self.coordinator.cached_phase_blocks(all_slots)
+        idx = index.get(id(current_block[0]))
+        if idx is None:
             return None
+        return blocks[idx + 1] if idx + 1 < len(blocks) else None
 
     @property
     def native_value(self):
@@ -0,0 +1,6 @@
+from custom_components.edf_freephase_dynamic_tariff.api.classification import parse_edf_iso
+
+
+def test_parse_edf_iso_fixed_positions():
+    assert parse_edf_iso("2024-03-05T16:30:00Z") == (2024, 3, 5, 990)
+    assert parse_edf_iso("not-a-timestamp") is None
@@ -0,0 +1,46 @@
+import pytest
+
+import aiohttp
+from aioresponses import aioresponses
+
+from custom_components.edf_freephase_dynamic_tariff.api.client import NotModified, iter_pages
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_not_modified():
+    url = "https://example.com/api"
+
+    with aioresponses() as mock:
+        mock.get(url, status=304)
+
+        validators = {"etag": '"abc"'}
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(NotModified):
+                async for _ in iter_pages(session, url, validators=validators):
+                    pass
+
+        assert validators == {"etag": '"abc"'}
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_refreshes_validators_on_200():
+    url = "https://example.com/api"
+
+    with aioresponses() as mock:
+        mock.get(
+            url,
+            payload={"results": [{"x": 1}], "next": None},
+            headers={"ETag": '"new"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+        validators = {"etag": '"old"', "stale": True}
+        async with aiohttp.ClientSession() as session:
+            pages = [page async for page in iter_pages(session, url, validators=validators)]
+
+        (request,) = next(iter(mock.requests.values()))
+        assert request.kwargs["headers"] == {"If-None-Match": '"old"'}
+        assert pages == [[{"x": 1}]]
+        assert validators == {
+            "etag": '"new"',
+            "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
@@ -0,0 +1,38 @@
+import pytest
+
+import aiohttp
+from aioresponses import aioresponses
+
+from custom_components.edf_freephase_dynamic_tariff.api.client import iter_pages
+from custom_components.edf_freephase_dynamic_tariff.api.parsing import build_unified_dataset_stream
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_non_json_raises_type_error():
+    url = "https://example.com/api"
+
+    with aioresponses() as mock:
+        mock.get(
+            url,
+            body="<html>Down for maintenance</html>",
+            content_type="text/html",
+        )
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(TypeError) as excinfo:
+                await build_unified_dataset_stream(iter_pages(session, url))
+
+    assert isinstance(excinfo.value.__cause__, aiohttp.ContentTypeError)
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_invalid_json_raises_type_error():
+    url = "https://example.com/api"
+
+    with aioresponses() as mock:
+        mock.get(url, body="{not json", content_type="application/json")
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(TypeError):
+                async for _ in iter_pages(session, url):
+                    pass
@@ -1,10 +1,11 @@
+import pytest
 pytestmark = pytest.mark.xfail(reason="Test suite temporarily disabled pending redesign")
 
 from datetime import datetime, timezone, timedelta
 
 from custom_components.edf_freephase_dynamic_tariff.api.parsing import (
+    UnifiedSlot,
     build_unified_dataset,
-    strip_internal,
     build_forecasts,
 )
 
@@ -25,24 +26,9 @@ def test_build_unified_dataset_sorts_and_parses():
 
     unified = build_unified_dataset(raw)
 
-    assert unified[0]["value"] == 5
-    assert unified[1]["value"] == 10
-    assert "_start_dt_obj" in unified[0]
-
-
-def test_strip_internal_removes_private_fields():
-    raw = [
-        {
-            "start": "x",
-            "end": "y",
-            "_start_dt_obj": 123,
-            "_end_dt_obj": 456,
-        }
-    ]
-
-    cleaned = strip_internal(raw)
-    assert "_start_dt_obj" not in cleaned[0]
-    assert "_end_dt_obj" not in cleaned[0]
+    assert unified[0].value == 5
+    assert unified[1].value == 10
+    assert unified[0].start_dt == datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc)
 
 
 def test_build_forecasts_next_24_hours():
@@ -53,15 +39,14 @@ def test_build_forecasts_next_24_hours():
         start = now + timedelta(minutes=30 * i)
         end = start + timedelta(minutes=30)
         unified.append(
-            {
-                "start": start.isoformat(),
-                "end": end.isoformat(),
-                "value": i,
-                "phase": "Green",
-                "currency": "GBP",
-                "_start_dt_obj": start,
-                "_end_dt_obj": end,
-            }
+            UnifiedSlot(
+                start=start.isoformat(),
+                end=end.isoformat(),
+                start_dt=start,
+                end_dt=end,
+                value=i,
+                phase="Green",
+            )
         )
 
     forecasts = build_forecasts(unified, now)
@@ -0,0 +1,55 @@
+from datetime import datetime, timezone, timedelta
+
+from custom_components.edf_freephase_dynamic_tariff.api.parsing import (
+    UnifiedSlot,
+    build_normalised_forecasts,
+    forecast_bounds,
+    normalise_unified_slot,
+)
+
+
+def test_normalise_unified_slot_returns_public_dict():
+    start = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    end = start + timedelta(minutes=30)
+    slot = UnifiedSlot(
+        start="2024-01-01T00:00:00Z",
+        end="2024-01-01T00:30:00Z",
+        start_dt=start,
+        end_dt=end,
+        value=5,
+        phase="Green",
+    )
+
+    normalised = normalise_unified_slot(slot)
+    assert normalised["start_dt"] == start
+    assert normalised["end_dt"] == end
+    assert normalised["phase"] == "green"
+    assert normalised["currency"] == "GBP"
+
+
+def test_build_normalised_forecasts_slices_shared_slots():
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+    start_of_day = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+    unified = []
+    for i in range(96):
+        start = start_of_day + timedelta(minutes=30 * i)
+        end = start + timedelta(minutes=30)
+        unified.append(
+            UnifiedSlot(
+                start=start.isoformat(),
+                end=end.isoformat(),
+                start_dt=start,
+                end_dt=end,
+                value=i,
+                phase="Green",
+            )
+        )
+
+    bounds = forecast_bounds(unified, now)
+    assert bounds["today_24_hours"] == (0, 48)
+    assert bounds["next_24_hours"] == (24, 72)
+
+    normalised = build_normalised_forecasts(unified, bounds)
+    assert len(normalised["all_slots_sorted"]) == 96
+    assert normalised["next_24_hours"][0] is normalised["all_slots_sorted"][24]
@@ -0,0 +1,29 @@
+import pytest
+
+from datetime import timedelta, timezone
+
+from custom_components.edf_freephase_dynamic_tariff.api.scheduler import AlignedScheduler
+
+
+@pytest.mark.asyncio
+async def test_scheduler_aligns_to_interval(hass):
+    scheduler = AlignedScheduler(hass, timedelta(seconds=30))
+
+    assert scheduler._seconds_until_boundary(1_700_000_020.25) == 19.75
+
+
+@pytest.mark.asyncio
+async def test_scheduler_boundary_is_always_in_future(hass):
+    scheduler = AlignedScheduler(hass, timedelta(seconds=30))
+
+    # Exactly on a boundary: the next one is a full interval away.
+    assert scheduler._seconds_until_boundary(1_700_000_010.0) == 30.0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_boundary_datetime_is_utc(hass):
+    scheduler = AlignedScheduler(hass, timedelta(seconds=30))
+
+    scheduler._compute_delay()
+
+    assert scheduler.next_boundary_datetime.tzinfo == timezone.utc
@@ -0,0 +1,33 @@
+import pytest
+
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+from aioresponses import aioresponses
+
+from custom_components.edf_freephase_dynamic_tariff.config_flow import PRODUCT_URL, _get_product_json
+
+
+@pytest.mark.asyncio
+async def test_get_product_json_does_not_retry_client_errors():
+    with aioresponses() as mock, patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        mock.get(PRODUCT_URL, status=404)
+        mock.get(PRODUCT_URL, payload={"code": "X"})
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(aiohttp.ClientResponseError):
+                await _get_product_json(session)
+
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_product_json_retries_server_errors():
+    with aioresponses() as mock, patch("asyncio.sleep", new=AsyncMock()) as sleep:
+        mock.get(PRODUCT_URL, status=503)
+        mock.get(PRODUCT_URL, payload={"code": "X"})
+
+        async with aiohttp.ClientSession() as session:
+            assert await _get_product_json(session) == {"code": "X"}
+
+    sleep.assert_awaited_once()
@@ -4,6 +4,7 @@ pytestmark = pytest.mark.xfail(reason="Test suite temporarily disabled pending r
 from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
 
+from custom_components.edf_freephase_dynamic_tariff.api.parsing import UnifiedSlot
 from custom_components.edf_freephase_dynamic_tariff.coordinator import EDFCoordinator
 
 
@@ -24,15 +25,14 @@ async def test_coordinator_success(hass):
     ]
 
     fake_unified = [
-        {
-            "_start_dt_obj": datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc),
-            "_end_dt_obj": datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc),
-            "start": "2024-01-01T00:00:00Z",
-            "end": "2024-01-01T00:30:00Z",
-            "value": 10,
-            "phase": "Green",
-            "currency": "GBP",
-        }
+        UnifiedSlot(
+            start="2024-01-01T00:00:00Z",
+            end="2024-01-01T00:30:00Z",
+            start_dt=datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc),
+            end_dt=datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc),
+            value=10,
+            phase="Green",
+        )
     ]
 
     fake_forecasts = {
@@ -0,0 +1,140 @@
+import pytest
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from homeassistant.core import State
+
+from custom_components.edf_freephase_dynamic_tariff import cost_coordinator
+from custom_components.edf_freephase_dynamic_tariff.cost_coordinator import CostCoordinator
+
+MIDNIGHT = datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+
+def _state(value, minutes):
+    return State(
+        "sensor.import",
+        str(value),
+        last_updated=MIDNIGHT + timedelta(minutes=minutes),
+    )
+
+
+def _slot(start_minutes, end_minutes, price=20.0):
+    start = MIDNIGHT + timedelta(minutes=start_minutes)
+    end = MIDNIGHT + timedelta(minutes=end_minutes)
+    return {
+        "start": start,
+        "end": end,
+        "start_ts": start.timestamp(),
+        "end_ts": end.timestamp(),
+        "price_p_per_kwh": price,
+        "phase": "green",
+    }
+
+
+def _delta(start_minutes, end_minutes, kwh):
+    return {
+        "start": MIDNIGHT + timedelta(minutes=start_minutes),
+        "end": MIDNIGHT + timedelta(minutes=end_minutes),
+        "kwh": kwh,
+    }
+
+
+def _row(start_minutes, end_minutes, change):
+    return {
+        "start": (MIDNIGHT + timedelta(minutes=start_minutes)).timestamp(),
+        "end": (MIDNIGHT + timedelta(minutes=end_minutes)).timestamp(),
+        "change": change,
+    }
+
+
+class _FakeRecorder:
+    async def async_add_executor_job(self, target, *args):
+        return target(*args)
+
+
+def test_slice_states_includes_state_in_effect_at_period_start():
+    states = [_state(1.0, -10), _state(1.5, 10), _state(2.0, 20), _state(3.0, 70)]
+
+    sliced = CostCoordinator._slice_states(states, MIDNIGHT, MIDNIGHT + timedelta(hours=1))
+
+    assert sliced == states[:3]
+
+
+def test_slice_states_starts_at_state_updated_exactly_at_period_start():
+    states = [_state(1.0, -10), _state(1.5, 0), _state(2.0, 20)]
+
+    sliced = CostCoordinator._slice_states(states, MIDNIGHT, MIDNIGHT + timedelta(hours=1))
+
+    assert sliced == states[1:]
+
+
+def test_align_splits_straddling_delta_by_overlap():
+    slots = [_slot(0, 30), _slot(30, 60, price=40.0)]
+
+    costs = list(CostCoordinator._align_deltas_to_slots(slots, [_delta(20, 40, 1.0)]))
+
+    assert [c.kwh for c in costs] == pytest.approx([0.5, 0.5])
+    assert [c.cost_gbp for c in costs] == pytest.approx([0.1, 0.2])
+
+
+def test_align_counts_delta_inside_slot_in_full():
+    slots = [_slot(0, 30), _slot(30, 60)]
+
+    costs = list(CostCoordinator._align_deltas_to_slots(slots, [_delta(35, 50, 0.75)]))
+
+    assert len(costs) == 1
+    assert costs[0].start == MIDNIGHT + timedelta(minutes=30)
+    assert costs[0].kwh == 0.75
+
+
+@pytest.mark.asyncio
+async def test_statistic_deltas_skip_empty_and_non_positive_changes(hass):
+    coordinator = CostCoordinator(hass, None, "sensor.import", timedelta(minutes=5))
+    rows = [_row(0, 5, 0.2), _row(5, 10, None), _row(10, 15, 0.0), _row(15, 20, -0.1)]
+
+    with patch.object(cost_coordinator, "get_instance", return_value=_FakeRecorder()), patch.object(
+        cost_coordinator.recorder_statistics,
+        "statistics_during_period",
+        return_value={"sensor.import": rows},
+    ):
+        deltas = await coordinator._fetch_statistic_deltas(MIDNIGHT, MIDNIGHT + timedelta(minutes=20))
+
+    assert deltas == [_delta(0, 5, 0.2)]
+    assert coordinator._period_complete is True
+
+
+@pytest.mark.asyncio
+async def test_statistic_deltas_without_change_fall_back_to_history(hass):
+    coordinator = CostCoordinator(hass, None, "sensor.import", timedelta(minutes=5))
+    rows = [_row(0, 5, None)]
+
+    with patch.object(cost_coordinator, "get_instance", return_value=_FakeRecorder()), patch.object(
+        cost_coordinator.recorder_statistics,
+        "statistics_during_period",
+        return_value={"sensor.import": rows},
+    ):
+        deltas = await coordinator._fetch_statistic_deltas(MIDNIGHT, MIDNIGHT + timedelta(minutes=5))
+
+    assert deltas is None
+
+
+@pytest.mark.asyncio
+async def test_history_deltas_share_one_query_across_periods(hass):
+    coordinator = CostCoordinator(hass, None, "sensor.import", timedelta(minutes=5))
+    coordinator._history_fetch_end = MIDNIGHT + timedelta(hours=2)
+    states = [_state(1.0, -10), _state(2.0, 30), _state(3.0, 90)]
+
+    with patch.object(cost_coordinator, "get_instance", return_value=_FakeRecorder()), patch.object(
+        cost_coordinator.recorder_history,
+        "get_significant_states",
+        return_value={"sensor.import": states},
+    ) as get_states:
+        first = await coordinator._fetch_history_deltas(MIDNIGHT, MIDNIGHT + timedelta(hours=1))
+        second = await coordinator._fetch_history_deltas(
+            MIDNIGHT + timedelta(hours=1), MIDNIGHT + timedelta(hours=2)
+        )
+
+    assert get_states.call_count == 1
+    assert first == [_delta(0, 30, 1.0)]
+    assert second == [_delta(60, 90, 1.0)]